@@ -1,11 +1,16 @@
 from __future__ import annotations
+from collections import OrderedDict
 from enum import auto
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 from base_enum import BaseEnum
+from elements import EffectivenessCalculator
 from team import MonsterTeam
 from monster_base import MonsterBase
 
+if TYPE_CHECKING:
+    from battle_trace import BattleTrace
+
 
 class Battle:
 
@@ -19,10 +24,19 @@ class Battle:
         TEAM2 = auto()
         DRAW = auto()
 
-    
+    EXCHANGE_CACHE_SIZE = 4096
 
-    def __init__(self, verbosity=0) -> None:
+    def __init__(self, verbosity=0, trace: Optional[BattleTrace] = None, exchange_cache_size: int = EXCHANGE_CACHE_SIZE) -> None:
         self.verbosity = verbosity
+        # Opt-in turn recorder; every hook is a single None check when unset.
+        self.trace = trace
+        # LRU memo of attack exchanges, see cached_battle_attack. A size of 0 turns it off.
+        self.exchange_cache_size = exchange_cache_size
+        self.exchange_cache = OrderedDict()
+        self.exchange_hits = 0
+        self.exchange_misses = 0
+        self.use_exchange_cache = False
+        self.exchange_table = None
 
     
     def process_turn(self) -> Optional[Battle.Result]:
@@ -45,10 +59,16 @@ class Battle:
             self.out1 = self.attack_before(self.team1, team1_act, self.out1)
         if team2_act != Battle.Action.ATTACK:
             self.out2 = self.attack_before(self.team2, team2_act,self.out2)
+
+        if self.trace is not None:
+            self._trace_begin(team1_act, team2_act)
         
         #If attack, work on the function after attack
         if team1_act == Battle.Action.ATTACK or team2_act == Battle.Action.ATTACK:
-            self.battle_attack(team1_act, team2_act)
+            if self.use_exchange_cache and self.out1.simple_mode and self.out2.simple_mode:
+                self.cached_battle_attack(team1_act, team2_act)
+            else:
+                self.battle_attack(team1_act, team2_act)
         
         #Decrease each mons health if they alive
         if self.out1.alive() and self.out2.alive():
@@ -107,6 +127,22 @@ class Battle:
             
 
 
+    def _trace_begin(self, act1: Battle.Action, act2: Battle.Action) -> None:
+        """Remember the actions and the monsters about to fight
+        Complexity O(1) for best and worst case"""
+        self._traced = (act1, act2, self.out1, self.out2, self.out1.get_hp(), self.out2.get_hp())
+
+    def _trace_end(self) -> None:
+        """Record the turn started by _trace_begin
+        Complexity O(1) for best and worst case"""
+        act1, act2, mons1, mons2, hp1, hp2 = self._traced
+        # A monster still alive but no longer out has been replaced by its evolution.
+        self.trace.record(
+            self.turn_number, act1.value, act2.value,
+            mons1, hp1 - mons1.get_hp(), mons1.alive() and self.out1 is not mons1,
+            mons2, hp2 - mons2.get_hp(), mons2.alive() and self.out2 is not mons2,
+        )
+
     def attack_before(self, team: MonsterTeam, act: Battle.Action, mons: MonsterBase): # before the battle
         """Return the monster to join in the battle
         Complexity O(n) for best and worst case where n is the of the team """
@@ -149,6 +185,31 @@ class Battle:
     
     
     
+    def cached_battle_attack(self, act1: Battle.Action, act2: Battle.Action) -> None:
+        """battle_attack through the exchange cache
+        In simple mode an exchange only depends on each monster's class, level and
+        HP and on both actions, and only changes the two HPs, so those HPs are
+        memoised. The least recently used exchange is dropped once the cache is full.
+        Cached HPs depend on the effectiveness table, so battle clears the cache
+        whenever EffectivenessCalculator.instance has been replaced.
+        Complexity O(1) for best case and O(comp) for worst case"""
+        out1 = self.out1
+        out2 = self.out2
+        key = (type(out1), out1.level, out1.current_hp, type(out2), out2.level, out2.current_hp, act1.value, act2.value)
+        hps = self.exchange_cache.get(key)
+        if hps is not None:
+            self.exchange_hits += 1
+            self.exchange_cache.move_to_end(key)
+            out1.set_hp(hps[0])
+            out2.set_hp(hps[1])
+            return
+
+        self.exchange_misses += 1
+        self.battle_attack(act1, act2)
+        self.exchange_cache[key] = (out1.get_hp(), out2.get_hp())
+        if len(self.exchange_cache) > self.exchange_cache_size:
+            self.exchange_cache.popitem(last=False)
+
     def battle(self, team1: MonsterTeam, team2: MonsterTeam) -> Battle.Result:
         if self.verbosity > 0:
             print(f"Team 1: {team1} vs. Team 2: {team2}")
@@ -158,9 +219,24 @@ class Battle:
         self.team2 = team2
         self.out1 = team1.retrieve_from_team()
         self.out2 = team2.retrieve_from_team()
+        # Custom action choices bypass the cache, as the lockstep engine refuses them too.
+        self.use_exchange_cache = (
+            self.exchange_cache_size > 0
+            and getattr(team1.choose_action, "__func__", None) is MonsterTeam.choose_action
+            and getattr(team2.choose_action, "__func__", None) is MonsterTeam.choose_action
+        )
+        if self.exchange_table is not EffectivenessCalculator.instance:
+            self.exchange_cache.clear()
+            self.exchange_table = EffectivenessCalculator.instance
         result = None
-        while result is None:
-            result = self.process_turn()
+        if self.trace is None:
+            while result is None:
+                result = self.process_turn()
+        else:
+            self.trace.start_battle()
+            while result is None:
+                result = self.process_turn()
+                self._trace_end()
         # Add any postgame logic here.
         return result
 
@@ -0,0 +1,397 @@
+from __future__ import annotations
+from array import array
+import math
+from typing import TYPE_CHECKING, Optional
+
+from battle import Battle
+from elements import EffectivenessCalculator, Element
+from helpers import get_all_monsters
+from monster_base import MonsterBase
+from team import MonsterTeam
+
+from data_structures.referential_array import ArrayR
+
+if TYPE_CHECKING:
+    from battle_trace import BattleTrace
+
+
+class LockstepBattleEngine:
+    """
+    Array-based battle engine for simple-stats matchups.
+
+    All battles in a batch are advanced one turn at a time in lockstep. Monster
+    state (roster index, level, starting level and HP) lives in flat integer
+    arrays, the roster's attack/defense/speed/max HP/element/evolution tables
+    are looked up by roster index, and each turn is split into phases that
+    only visit the battles selected by the ATTACK/SWAP/SPECIAL masks.
+
+    It produces the same Battle.Result and turn count as Battle.battle for the
+    same teams, as long as every monster is a roster class in simple mode. The
+    input teams are read, not consumed. With a BattleTrace it also writes the
+    same per-turn records as Battle, interleaved across the batch.
+
+    Usage:
+        engine = LockstepBattleEngine()
+        results = engine.run(teams1, teams2)
+    """
+
+    ATTACK = Battle.Action.ATTACK.value
+    SWAP = Battle.Action.SWAP.value
+    SPECIAL = Battle.Action.SPECIAL.value
+
+    def __init__(self, trace: Optional[BattleTrace] = None) -> None:
+        """Build the roster tables once
+        Complexity O(m + e*e) for best and worst case where m is the roster size and e the number of elements"""
+        self.trace = trace
+        monsters = get_all_monsters()
+        self.roster_index = {}
+        self.attack = array("l")
+        self.defense = array("l")
+        self.speed = array("l")
+        self.max_hp = array("l")
+        self.element = array("l")
+        self.evolution = array("l")
+        for i in range(len(monsters)):
+            self.roster_index[monsters[i]] = i
+        for i in range(len(monsters)):
+            stats = monsters[i].get_simple_stats()
+            self.attack.append(stats.get_attack())
+            self.defense.append(stats.get_defense())
+            self.speed.append(stats.get_speed())
+            self.max_hp.append(stats.get_max_hp())
+            self.element.append(monsters[i].get_element_type().value)
+            evolution = monsters[i].get_evolution()
+            self.evolution.append(-1 if evolution is None else self.roster_index[evolution])
+
+        # Effectiveness for every (attacker, defender) element value, fetched in one bulk call.
+        self.n_elements = len(Element.__members__) + 1
+        attackers = array("l")
+        defenders = array("l")
+        for i in range(self.n_elements):
+            for j in range(self.n_elements):
+                attackers.append(i)
+                defenders.append(j)
+        self.effectiveness = EffectivenessCalculator.get_effectiveness_many(attackers, defenders)
+
+        self.turns = array("l")
+
+    def battle(self, team1: MonsterTeam, team2: MonsterTeam) -> Battle.Result:
+        """Simulate a single battle
+        Complexity O(t) for best and worst case where t is the number of turns"""
+        return self.run(ArrayR.from_list([team1]), ArrayR.from_list([team2]))[0]
+
+    def run(
+        self,
+        teams1: ArrayR[MonsterTeam],
+        teams2: ArrayR[MonsterTeam],
+        policy1: Optional[Battle.Action] = None,
+        policy2: Optional[Battle.Action] = None,
+    ) -> ArrayR[Battle.Result]:
+        """
+        Simulate teams1[i] against teams2[i] for every i and return the results.
+        The number of turns each battle took is left in self.turns.
+
+        A policy of None uses MonsterTeam.choose_action, any other value makes
+        that side always pick the given action. Teams that override
+        choose_action need an explicit policy.
+        :raises ValueError: if the batch cannot be represented by this engine.
+        Complexity O(b * t) for best and worst case where b is the number of battles and t the longest battle
+        """
+        if len(teams1) != len(teams2):
+            raise ValueError("Both sides need the same number of teams")
+        n_battles = len(teams1)
+
+        # Per monster slot state.
+        self.cls = array("l")
+        self.level = array("l")
+        self.level0 = array("l")
+        self.hp = array("l")
+
+        # Per (battle, side) state, side-major index 2*b + side.
+        self.modes = array("l")
+        self.keys = array("l")
+        self.memory_keys = array("l")
+        self.containers = []
+        self.policies = array("l")
+        for b in range(n_battles):
+            for team, policy in ((teams1[b], policy1), (teams2[b], policy2)):
+                self._load_team(team, policy)
+
+        out = array("l", [0]) * (2 * n_battles)
+        for i in range(2 * n_battles):
+            out[i] = self._retrieve(i)
+
+        self.turns = array("l", [0]) * n_battles
+        results = ArrayR(n_battles)
+        active = list(range(n_battles))
+        act = array("l", [0]) * (2 * n_battles)
+        trace = self.trace
+        if trace is not None:
+            # Who fought each turn, with their class and HP before the attacks.
+            first_battle = trace.battle_index + 1
+            trace.battle_index += n_battles
+            fighters = array("l", [0]) * (2 * n_battles)
+            cls0 = array("l", [0]) * (2 * n_battles)
+            hp0 = array("l", [0]) * (2 * n_battles)
+        while active:
+            # Phase 1: choose actions, team 2 first as in Battle.process_turn.
+            for b in active:
+                act[2*b + 1] = self._choose(2*b + 1, out[2*b + 1], out[2*b])
+                act[2*b] = self._choose(2*b, out[2*b], out[2*b + 1])
+
+            # Phase 2: SWAP/SPECIAL mask.
+            for b in active:
+                for i in (2*b, 2*b + 1):
+                    if act[i] != self.ATTACK:
+                        self._add(i, out[i])
+                        if act[i] == self.SPECIAL:
+                            self._special(i)
+                        out[i] = self._retrieve(i)
+
+            if trace is not None:
+                for b in active:
+                    for i in (2*b, 2*b + 1):
+                        fighters[i] = out[i]
+                        cls0[i] = self.cls[out[i]]
+                        hp0[i] = self.hp[out[i]]
+
+            # Phase 3: ATTACK mask.
+            for b in active:
+                a1, a2 = act[2*b], act[2*b + 1]
+                m1, m2 = out[2*b], out[2*b + 1]
+                if a1 == self.ATTACK and a2 == self.ATTACK:
+                    s1 = self.speed[self.cls[m1]]
+                    s2 = self.speed[self.cls[m2]]
+                    if s1 == s2:
+                        self._attack(m1, m2)
+                        self._attack(m2, m1)
+                    elif s1 > s2:
+                        self._attack(m1, m2)
+                        if self.hp[m2] > 0:
+                            self._attack(m2, m1)
+                    else:
+                        self._attack(m2, m1)
+                        if self.hp[m1] > 0:
+                            self._attack(m1, m2)
+                elif a2 == self.ATTACK:
+                    self._attack(m2, m1)
+                elif a1 == self.ATTACK:
+                    self._attack(m1, m2)
+
+            # Phase 4: end of turn, fainting and results.
+            still_active = []
+            for b in active:
+                result = self._end_turn(b, out)
+                if trace is not None:
+                    self._trace_turn(first_battle + b, b, act, fighters, cls0, hp0)
+                if result is None:
+                    still_active.append(b)
+                else:
+                    results[b] = result
+            active = still_active
+
+        return results
+
+    def _trace_turn(self, index: int, b: int, act: array, fighters: array, cls0: array, hp0: array) -> None:
+        """Write battle b's turn to the trace, describing each fighter as Battle does:
+        its pre-evolution class and HP, and its level after levelling up.
+        Complexity O(1) for best and worst case"""
+        fields = [index, self.turns[b], act[2*b], act[2*b + 1]]
+        for i in (2*b, 2*b + 1):
+            slot = fighters[i]
+            cls = self.cls[slot]
+            hp = self.hp[slot]
+            if cls != cls0[i]:
+                # Undo the HP shift of evolving in place.
+                hp += self.max_hp[cls0[i]] - self.max_hp[cls]
+            fields += (cls0[i], hp0[i] - hp, hp, self.level[slot], cls != cls0[i])
+        self.trace.append(*fields)
+
+    def _load_team(self, team: MonsterTeam, policy: Optional[Battle.Action]) -> None:
+        """Copy a team's container into the slot arrays
+        Complexity O(n) for best and worst case where n is the team size"""
+        if policy is None and getattr(team.choose_action, "__func__", None) is not MonsterTeam.choose_action:
+            raise ValueError("Teams with a custom choose_action need an explicit policy")
+        self.policies.append(0 if policy is None else policy.value)
+        self.modes.append(team.team_mode.value)
+        self.keys.append(0 if team.key is None else team.key.value)
+        self.memory_keys.append(team.memory_key)
+
+        container = []
+        members = team.team
+        if team.team_mode == MonsterTeam.TeamMode.FRONT:
+            # Bottom to top, retrieve pops from the end.
+            for i in range(len(members)):
+                container.append(self._load_monster(members.array[i]))
+        elif team.team_mode == MonsterTeam.TeamMode.BACK:
+            # Front to rear, retrieve pops from the start.
+            for i in range(len(members)):
+                container.append(self._load_monster(members.array[(members.front + i) % len(members.array)]))
+        else:
+            # [key, slot] pairs in sorted order, retrieve pops from the start.
+            for i in range(len(members)):
+                container.append([members[i].key, self._load_monster(members[i].value)])
+        self.containers.append(container)
+
+    def _load_monster(self, monster: MonsterBase) -> int:
+        """Allocate a slot for a monster and return its index
+        Complexity O(1) for best and worst case"""
+        if type(monster) not in self.roster_index or not monster.simple_mode:
+            raise ValueError(f"{monster} is not a simple mode roster monster")
+        self.cls.append(self.roster_index[type(monster)])
+        self.level.append(monster.level)
+        self.level0.append(monster.level_current)
+        self.hp.append(monster.get_hp())
+        return len(self.cls) - 1
+
+    def _choose(self, i: int, mine: int, enemy: int) -> int:
+        """Action of the team at index i, following MonsterTeam.choose_action
+        Complexity O(1) for best and worst case"""
+        if self.policies[i]:
+            return self.policies[i]
+        if self.speed[self.cls[mine]] >= self.speed[self.cls[enemy]] or self.hp[mine] >= self.hp[enemy]:
+            return self.ATTACK
+        return self.SWAP
+
+    def _sort_value(self, i: int, slot: int) -> int:
+        """The stat an OPTIMISE team at index i sorts by
+        Complexity O(1) for best and worst case"""
+        key = self.keys[i]
+        if key == MonsterTeam.SortMode.HP.value:
+            return self.hp[slot]
+        elif key == MonsterTeam.SortMode.ATTACK.value:
+            return self.attack[self.cls[slot]]
+        elif key == MonsterTeam.SortMode.DEFENSE.value:
+            return self.defense[self.cls[slot]]
+        elif key == MonsterTeam.SortMode.SPEED.value:
+            return self.speed[self.cls[slot]]
+        return self.level[slot]
+
+    def _insert_sorted(self, container: list, item: list) -> None:
+        """Insert a [key, slot] pair where ArraySortedList.add would put it
+        Complexity O(n) for best and worst case where n is the team size"""
+        low = 0
+        high = len(container) - 1
+        while low <= high:
+            mid = (low + high) // 2
+            if container[mid][0] < item[0]:
+                low = mid + 1
+            elif container[mid][0] > item[0]:
+                high = mid - 1
+            else:
+                low = mid
+                break
+        container.insert(low, item)
+
+    def _add(self, i: int, slot: int) -> None:
+        """MonsterTeam.add_to_team for the team at index i
+        Complexity O(n) for best and worst case where n is the team size"""
+        if self.modes[i] == MonsterTeam.TeamMode.OPTIMISE.value:
+            self._insert_sorted(self.containers[i], [self.memory_keys[i] * self._sort_value(i, slot), slot])
+        else:
+            self.containers[i].append(slot)
+
+    def _retrieve(self, i: int) -> int:
+        """MonsterTeam.retrieve_from_team for the team at index i
+        Complexity O(n) for best and worst case where n is the team size"""
+        container = self.containers[i]
+        if self.modes[i] == MonsterTeam.TeamMode.FRONT.value:
+            return container.pop()
+        elif self.modes[i] == MonsterTeam.TeamMode.BACK.value:
+            return container.pop(0)
+        return container.pop(0)[1]
+
+    def _special(self, i: int) -> None:
+        """MonsterTeam.special for the team at index i
+        Complexity O(n) for best and worst case where n is the team size"""
+        container = self.containers[i]
+        n = len(container)
+        if self.modes[i] == MonsterTeam.TeamMode.FRONT.value:
+            if n >= 2:
+                k = min(n, 3)
+                container[n - k:] = container[n - k:][::-1]
+        elif self.modes[i] == MonsterTeam.TeamMode.BACK.value:
+            half = n // 2
+            container[:] = container[half:][::-1] + container[:half]
+        else:
+            self.memory_keys[i] = -self.memory_keys[i]
+            for _ in range(n):
+                item = container.pop(0)
+                item[0] = -item[0]
+                self._insert_sorted(container, item)
+
+    def _attack(self, attacker: int, defender: int) -> None:
+        """MonsterBase.attack between two slots
+        Complexity O(1) for best and worst case"""
+        attack_var = self.attack[self.cls[attacker]]
+        defense_var = self.defense[self.cls[defender]]
+        if defense_var < attack_var / 2:
+            damage = attack_var - defense_var
+        elif defense_var < attack_var:
+            damage = attack_var * (5 / 8) - (defense_var / 4)
+        else:
+            damage = attack_var / 4
+        effectiveness = self.effectiveness[self.element[self.cls[attacker]] * self.n_elements + self.element[self.cls[defender]]]
+        self.hp[defender] -= math.ceil(damage * effectiveness)
+
+    def _level_up(self, slot: int) -> None:
+        """Level up a slot and evolve it if ready
+        Complexity O(1) for best and worst case"""
+        self.level[slot] += 1
+        cls = self.cls[slot]
+        if self.evolution[cls] != -1 and self.level[slot] != self.level0[slot]:
+            evolved = self.evolution[cls]
+            self.hp[slot] = self.max_hp[evolved] - (self.max_hp[cls] - self.hp[slot])
+            self.cls[slot] = evolved
+            self.level0[slot] = self.level[slot]
+
+    def _end_turn(self, b: int, out: array) -> Optional[Battle.Result]:
+        """Tail of Battle.process_turn for battle b
+        Complexity O(n) for best and worst case where n is the team size"""
+        m1, m2 = out[2*b], out[2*b + 1]
+        if self.hp[m1] > 0 and self.hp[m2] > 0:
+            self.hp[m1] -= 1
+            self.hp[m2] -= 1
+        self.turns[b] += 1
+
+        alive1 = self.hp[m1] > 0
+        alive2 = self.hp[m2] > 0
+        empty1 = len(self.containers[2*b]) == 0
+        empty2 = len(self.containers[2*b + 1]) == 0
+        if alive1 and alive2:
+            return None
+        elif alive2:
+            self._level_up(m2)
+            if empty1:
+                return Battle.Result.TEAM2
+            out[2*b] = self._retrieve(2*b)
+            return None
+        elif alive1:
+            self._level_up(m1)
+            if empty2:
+                return Battle.Result.TEAM1
+            out[2*b + 1] = self._retrieve(2*b + 1)
+            return None
+        elif empty1 and empty2:
+            return Battle.Result.DRAW
+        elif empty2:
+            return Battle.Result.TEAM1
+        elif empty1:
+            return Battle.Result.TEAM2
+        out[2*b] = self._retrieve(2*b)
+        out[2*b + 1] = self._retrieve(2*b + 1)
+        return None
+
+
+if __name__ == "__main__":
+    from random_gen import RandomGen
+
+    RandomGen.set_seed(129371)
+    n = 1000
+    teams1 = ArrayR(n)
+    teams2 = ArrayR(n)
+    for i in range(n):
+        teams1[i] = MonsterTeam(MonsterTeam.TeamMode.BACK, MonsterTeam.SelectionMode.RANDOM)
+        teams2[i] = MonsterTeam(MonsterTeam.TeamMode.FRONT, MonsterTeam.SelectionMode.RANDOM)
+    results = LockstepBattleEngine().run(teams1, teams2)
+    print(results[0], results[1], results[2])
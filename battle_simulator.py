@@ -0,0 +1,117 @@
+from __future__ import annotations
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Iterator, Optional
+
+from battle import Battle
+from random_gen import RandomGen
+from team import TeamSpec
+
+
+class Matchup:
+    """
+    A single battle to simulate: the two team specs and the seed used to build them.
+
+    If seed is None, BattleSimulator uses the start of substream i of its own
+    seed (see RandomGen.stream), where i is the position of the matchup in the batch.
+    """
+
+    def __init__(self, team1: TeamSpec, team2: TeamSpec, seed: Optional[int] = None) -> None:
+        """Store the matchup
+        Complexity O(1) for best and worst case"""
+        self.team1 = team1
+        self.team2 = team2
+        self.seed = seed
+
+
+def _run_chunk(chunk: list[tuple[int, TeamSpec, TeamSpec]]) -> list[tuple[Battle.Result, int]]:
+    """Run a chunk of seeded matchups and return (result, turns) for each one.
+    Module level so it can be sent to worker processes.
+    Complexity O(n * comp) for best and worst case where n is the chunk size
+    """
+    saved_seed = RandomGen.seed
+    battle = Battle(verbosity=0)
+    results = []
+    try:
+        for seed, spec1, spec2 in chunk:
+            RandomGen.set_seed(seed)
+            team1 = spec1.build()
+            team2 = spec2.build()
+            result = battle.battle(team1, team2)
+            results.append((result, battle.turn_number))
+    finally:
+        # Running in process must not disturb the caller's stream, even on error.
+        RandomGen.seed = saved_seed
+    return results
+
+
+class BattleSimulator:
+    """
+    Runs large batches of independent battles, optionally across a process pool.
+
+    Every matchup is built from its own seed, so the results do not depend on
+    how many workers are used or how the batch is chunked.
+
+    Usage:
+        sim = BattleSimulator(seed=123)
+        for result, turns in sim.run_many(matchups, workers=4):
+            ...
+    """
+
+    CHUNK_SIZE = 64
+
+    def __init__(self, seed: Optional[int] = None) -> None:
+        """Set the base seed used to derive per-matchup seeds
+        Complexity O(1) for best and worst case"""
+        self.seed = RandomGen.seed if seed is None else seed
+
+    def _seeded_chunks(self, matchups: Iterable[Matchup], chunk_size: int) -> Iterator[list]:
+        """Yield lists of (seed, spec1, spec2), deriving missing seeds in batch order
+        Complexity O(n) for best and worst case where n is the number of matchups"""
+        chunk = []
+        for index, matchup in enumerate(matchups):
+            # Matchup i gets substream i of our seed, without touching the global one.
+            seed = RandomGen.stream(index, self.seed).seed if matchup.seed is None else matchup.seed
+            chunk.append((seed, matchup.team1, matchup.team2))
+            if len(chunk) == chunk_size:
+                yield chunk
+                chunk = []
+        if chunk:
+            yield chunk
+
+    def run_many(
+        self,
+        matchups: Iterable[Matchup],
+        workers: Optional[int] = None,
+        chunk_size: int = CHUNK_SIZE,
+    ) -> Iterator[tuple[Battle.Result, int]]:
+        """
+        Simulate every matchup and yield (Battle.Result, turn count) in input order.
+
+        workers=None or 1 runs in this process. Otherwise battles are fanned out
+        to a ProcessPoolExecutor, keeping at most two chunks per worker in flight
+        so arbitrarily long iterables can be streamed.
+        Complexity O(n * comp) for best and worst case where n is the number of matchups
+        """
+        chunks = self._seeded_chunks(matchups, chunk_size)
+        if workers is None or workers <= 1:
+            for chunk in chunks:
+                yield from _run_chunk(chunk)
+            return
+
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            pending = []
+            for chunk in chunks:
+                pending.append(pool.submit(_run_chunk, chunk))
+                if len(pending) >= 2 * workers:
+                    yield from pending.pop(0).result()
+            for future in pending:
+                yield from future.result()
+
+
+if __name__ == "__main__":
+    from team import MonsterTeam
+
+    spec = TeamSpec(MonsterTeam.TeamMode.BACK, MonsterTeam.SelectionMode.RANDOM)
+    sim = BattleSimulator(seed=129371)
+    for result, turns in sim.run_many((Matchup(spec, spec) for _ in range(10)), workers=2):
+        print(result, turns)
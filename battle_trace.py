@@ -0,0 +1,175 @@
+from __future__ import annotations
+import struct
+from typing import BinaryIO, Iterator, NamedTuple, Optional
+
+from helpers import get_all_monsters
+from monster_base import MonsterBase
+
+
+class TraceRecord(NamedTuple):
+    """One decoded turn. Side fields are suffixed 1 and 2."""
+    battle: int
+    turn: int
+    action1: int
+    action2: int
+    monster1: int
+    damage1: int
+    hp1: int
+    level1: int
+    evolved1: int
+    monster2: int
+    damage2: int
+    hp2: int
+    level2: int
+    evolved2: int
+
+
+class BattleTrace:
+    """
+    Fixed-width binary record of every turn of one or more battles.
+
+    Each record is RECORD.size bytes: battle and turn number, both actions
+    (Battle.Action values), then for each side the roster index of the monster
+    that fought, the HP it lost this turn, its HP and level at the end of the
+    turn and whether it evolved. Monsters outside the roster are NO_MONSTER.
+
+    Records are appended to a bytearray. With a stream the buffer is written
+    out whenever it reaches flush_bytes, so a trace of any length uses constant
+    memory; without one every record stays in memory and can be iterated.
+
+    Usage:
+        with BattleTrace.open("battles.trace") as trace:
+            Battle(trace=trace).battle(team1, team2)
+        for record in BattleTrace.read("battles.trace"):
+            ...
+    """
+
+    RECORD = struct.Struct("<IIBBHiiHBHiiHB")
+    FLUSH_BYTES = 1 << 16
+    NO_MONSTER = 0xFFFF
+
+    def __init__(self, stream: Optional[BinaryIO] = None, flush_bytes: int = FLUSH_BYTES) -> None:
+        """Create an empty trace, optionally streaming to a binary file object
+        Complexity O(m) for best and worst case where m is the roster size"""
+        self.stream = stream
+        self.flush_bytes = flush_bytes
+        self.buffer = bytearray()
+        self.battle_index = -1
+        self.count = 0
+        self.roster_index = {}
+        monsters = get_all_monsters()
+        for i in range(len(monsters)):
+            self.roster_index[monsters[i]] = i
+
+    @classmethod
+    def open(cls, path: str, flush_bytes: int = FLUSH_BYTES) -> BattleTrace:
+        """A trace streaming to a new file at path
+        Complexity O(m) for best and worst case where m is the roster size"""
+        return cls(open(path, "wb"), flush_bytes)
+
+    def start_battle(self) -> None:
+        """Begin numbering turns of the next battle
+        Complexity O(1) for best and worst case"""
+        self.battle_index += 1
+
+    def record(
+        self,
+        turn: int,
+        action1: int,
+        action2: int,
+        monster1: MonsterBase,
+        damage1: int,
+        evolved1: bool,
+        monster2: MonsterBase,
+        damage2: int,
+        evolved2: bool,
+    ) -> None:
+        """Append one turn; the monsters' HP and level are read now
+        Complexity O(1) amortised for best and worst case"""
+        self.append(
+            self.battle_index, turn, action1, action2,
+            self.roster_index.get(type(monster1), self.NO_MONSTER), damage1,
+            monster1.get_hp(), monster1.get_level(), evolved1,
+            self.roster_index.get(type(monster2), self.NO_MONSTER), damage2,
+            monster2.get_hp(), monster2.get_level(), evolved2,
+        )
+
+    def append(self, *fields: int) -> None:
+        """Append one turn given as raw TraceRecord fields, for engines without monster objects
+        Complexity O(1) amortised for best and worst case"""
+        self.buffer += self.RECORD.pack(*fields)
+        self.count += 1
+        if self.stream is not None and len(self.buffer) >= self.flush_bytes:
+            self.flush()
+
+    def flush(self) -> None:
+        """Write buffered records to the stream
+        Complexity O(n) for best and worst case where n is the buffered size"""
+        if self.stream is not None and self.buffer:
+            self.stream.write(self.buffer)
+            self.stream.flush()
+            self.buffer.clear()
+
+    def close(self) -> None:
+        """Flush and close the stream, if any
+        Complexity O(n) for best and worst case where n is the buffered size"""
+        self.flush()
+        if self.stream is not None:
+            self.stream.close()
+            self.stream = None
+
+    def __enter__(self) -> BattleTrace:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+    def __len__(self) -> int:
+        """Number of records written so far, flushed or not"""
+        return self.count
+
+    def __iter__(self) -> Iterator[TraceRecord]:
+        """Records still held in the buffer (all of them when not streaming)
+        Complexity O(n) for best and worst case where n is the buffered records"""
+        for fields in self.RECORD.iter_unpack(self.buffer):
+            yield TraceRecord(*fields)
+
+    def __getitem__(self, index: int) -> TraceRecord:
+        """The buffered record at index
+        Complexity O(1) for best and worst case"""
+        if not 0 <= index < len(self.buffer) // self.RECORD.size:
+            raise IndexError("Trace record index out of range")
+        return TraceRecord(*self.RECORD.unpack_from(self.buffer, index * self.RECORD.size))
+
+    @classmethod
+    def read(cls, path: str, chunk_records: int = 4096) -> Iterator[TraceRecord]:
+        """Stream the records of a trace file back, a chunk at a time
+        Complexity O(n) for best and worst case where n is the number of records"""
+        size = cls.RECORD.size
+        with open(path, "rb") as file:
+            while True:
+                chunk = file.read(size * chunk_records)
+                if not chunk:
+                    return
+                if len(chunk) % size:
+                    raise ValueError(f"{path} is truncated")
+                for fields in cls.RECORD.iter_unpack(chunk):
+                    yield TraceRecord(*fields)
+
+
+def first_divergence(trace1: BattleTrace, trace2: BattleTrace) -> int:
+    """
+    Index of the first record where two in-memory traces differ, or -1 if they match.
+
+    If one trace is a prefix of the other, the index is the length of the
+    shorter one. Records are compared as raw bytes, without decoding.
+    Complexity O(n) for best and worst case where n is the number of records
+    """
+    size = BattleTrace.RECORD.size
+    # Views avoid copying; released on exit so the buffers can grow again.
+    with memoryview(trace1.buffer) as view1, memoryview(trace2.buffer) as view2:
+        shortest = min(len(view1), len(view2)) // size
+        for i in range(shortest):
+            if view1[i * size:(i + 1) * size] != view2[i * size:(i + 1) * size]:
+                return i
+        return -1 if len(view1) == len(view2) else shortest
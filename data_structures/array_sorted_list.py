@@ -58,22 +58,18 @@ class ArraySortedList(SortedList[T]):
 
     def _shuffle_right(self, index: int) -> None:
         """ Shuffle items to the right up to a given position. """
-        for i in range(len(self), index, -1):
-            self.array[i] = self.array[i - 1]
+        self.array.move(index, index + 1, len(self) - index)
 
     def _shuffle_left(self, index: int) -> None:
         """ Shuffle items starting at a given position to the left. """
-        for i in range(index, len(self)):
-            self.array[i] = self.array[i + 1]
+        self.array.move(index + 1, index, len(self) - index)
 
-    def _resize(self) -> None:
-        """ Resize the list. """
-        # doubling the size of our list
-        new_array = ArrayR(2 * len(self.array))
+    def _resize(self, min_capacity: int = 0) -> None:
+        """ Resize the list, at least doubling it and to no less than min_capacity. """
+        new_array = ArrayR(max(2 * len(self.array), min_capacity))
 
         # copying the contents
-        for i in range(self.length):
-            new_array[i] = self.array[i]
+        self.array.copy_into(new_array, self.length)
 
         # referring to the new array
         self.array = new_array
@@ -87,6 +83,118 @@ class ArraySortedList(SortedList[T]):
         self._shuffle_left(index)
         return item
 
+    def reverse(self) -> None:
+        """ Negate every key in place.
+            The result, including the order of equal keys, is the same as
+            deleting the item at index 0 and re-adding it with its key negated,
+            len(self) times, but is worked out directly:
+
+            * While the front key is negative, the deleted item comes back
+              positive, after the negative items still waiting. Those c items
+              are linked into the non-negative ones in a single pass; where a
+              key ties, the index add would have picked is found by replaying
+              its binary search on counts alone (_search_position).
+            * The other n - c steps only move the front item within the block
+              of smallest keys, negating it twice, so together they rotate a
+              prefix of that block, plus one negation when n - c is odd.
+            :complexity: O(n) without ties, O(n log n) worst case
+        """
+        n = len(self)
+        if n == 0:
+            return
+        items = ArrayR(n)
+        self.array.copy_into(items, n)
+        c = 0
+        while c < n and items[c].key < 0:
+            c += 1
+
+        if c > 0:
+            # Linked list of positions in items, n is the head; starts as the non-negative items.
+            link = ArrayR(n + 1)
+            node = n
+            for i in range(c, n):
+                link[node] = i
+                node = i
+            link[node] = -1
+
+            # items[c:lt_end] have keys below the negated key, items[lt_end:eq_end] equal it.
+            lt_end = n
+            eq_end = n
+            run = 0
+            previous = n
+            previous_offset = 0
+            for j in range(c):
+                key = -items[j].key
+                while lt_end > c and items[lt_end - 1].key >= key:
+                    lt_end -= 1
+                while eq_end > lt_end and items[eq_end - 1].key > key:
+                    eq_end -= 1
+                # Earlier items with the same key, already negated, are in the same block.
+                run = run + 1 if j > 0 and items[j - 1].key == key else 0
+
+                # The list add searches: c-1-j negatives, then the lower keys, then the block.
+                start = c - 1 - j + lt_end - c
+                offset = self._search_position(n - 1, start, start + eq_end - lt_end + run) - start
+                if run > 0 and offset == previous_offset + 1:
+                    node = previous
+                else:
+                    node = lt_end - 1 if lt_end > c else n
+                    for _ in range(offset):
+                        node = link[node]
+                link[j] = link[node]
+                link[node] = j
+                items[j].key = key
+                previous = j
+                previous_offset = offset
+
+            node = link[n]
+            for k in range(n):
+                self.array[k] = items[node]
+                node = link[node]
+
+        steps = n - c
+        if steps == 0:
+            return
+        smallest = self.array[0].key
+        block = 1
+        while block < n and self.array[block].key == smallest:
+            block += 1
+        # Where the front item is re-added among the other n-1 items.
+        position = self._search_position(n - 1, 0, block - 1)
+        if smallest == 0:
+            # Negating 0 changes nothing, every step is a move.
+            shift = steps % (position + 1)
+            negate_front = False
+        else:
+            # Each pair of steps moves the front item and restores its key.
+            shift = (steps // 2) % (position + 1)
+            negate_front = steps % 2 == 1
+        if shift:
+            self.array.copy_into(items, shift)
+            self.array.move(shift, 0, position + 1 - shift)
+            items.copy_into(self.array, shift, 0, position + 1 - shift)
+        if negate_front:
+            self.array[0].key = -self.array[0].key
+
+    @staticmethod
+    def _search_position(length: int, equal_start: int, equal_stop: int) -> int:
+        """ The index _index_to_add returns on a list of the given length whose
+            keys are below the target before equal_start, equal to it up to
+            equal_stop and above it after, without looking at the list.
+            :complexity: O(log length)
+        """
+        low = 0
+        high = length - 1
+        while low <= high:
+            mid = (low + high) // 2
+            if mid < equal_start:
+                low = mid + 1
+            elif mid >= equal_stop:
+                high = mid - 1
+            else:
+                return mid
+        return low
+
     def index(self, item: ListItem) -> int:
         """ Find the position of a given item in the list. """
         pos = self._index_to_add(item)
@@ -109,6 +217,65 @@ class ArraySortedList(SortedList[T]):
         self[position] = item
         self.length += 1
 
+    def add_all(self, items: ArrayR[ListItem]) -> None:
+        """ Add every item of an array to the list.
+            The new items are merge sorted once and merged into the list from the
+            back, instead of one binary search insert (and shuffle) per item.
+            The sort is stable: items with equal keys keep their relative order
+            and come after equal keys already in the list.
+            :complexity: O(m log m + n) where m is len(items) and n is len(self)
+        """
+        count = len(items)
+        if count == 0:
+            return
+        new_items = self._sorted_copy(items)
+        if len(self) + count > len(self.array):
+            self._resize(len(self) + count)
+
+        # merge from the back so nothing is overwritten before it is moved
+        i = len(self) - 1
+        j = count - 1
+        k = len(self) + count - 1
+        while j >= 0:
+            if i >= 0 and self.array[i].key > new_items[j].key:
+                self.array[k] = self.array[i]
+                i -= 1
+            else:
+                self.array[k] = new_items[j]
+                j -= 1
+            k -= 1
+        self.length += count
+
+    @staticmethod
+    def _sorted_copy(items: ArrayR[ListItem]) -> ArrayR[ListItem]:
+        """ Bottom-up stable merge sort of the items by key, into a new array.
+            :complexity: O(m log m) where m is len(items)
+        """
+        count = len(items)
+        source = ArrayR(count)
+        items.copy_into(source, count)
+        target = ArrayR(count)
+        width = 1
+        while width < count:
+            for low in range(0, count, 2 * width):
+                mid = min(low + width, count)
+                high = min(low + 2 * width, count)
+                i, j, k = low, mid, low
+                while i < mid and j < high:
+                    if source[j].key < source[i].key:
+                        target[k] = source[j]
+                        j += 1
+                    else:
+                        target[k] = source[i]
+                        i += 1
+                    k += 1
+                # one of the runs is exhausted, block copy the rest of the other
+                source.copy_into(target, mid - i, i, k)
+                source.copy_into(target, high - j, j, k + mid - i)
+            source, target = target, source
+            width *= 2
+        return source
+
     def _index_to_add(self, item: ListItem) -> int:
         """ Find the position where the new item should be placed. """
         low = 0
@@ -5,6 +5,13 @@
 from __future__ import annotations
 from data_structures.set_adt import Set
 
+if hasattr(int, "bit_count"):
+    _popcount = int.bit_count
+else:
+    # int.bit_count is Python 3.10+.
+    def _popcount(value: int) -> int:
+        return bin(value).count("1")
+
 class BSet(Set[int]):
     """A bit-vector implementation of the set ADT. The set is represented
         as an integer. The element is present in the set if and only if the
@@ -36,14 +43,21 @@ class BSet(Set[int]):
 
     def __len__(self) -> int:
         """
-        Size computation. The most expensive operation.
-        Use int.bit_length(your_integer) to calculate the bit length.
+        Size computation, a population count of the bit vector.
+        :complexity: O(1) for the set sizes used here (int.bit_count), O(n) on the bin() fallback.
         """
-        res = 0
-        for item in range(1, int.bit_length(self.elems) + 1):
-            if item in self:
-                res += 1
-        return res
+        return _popcount(self.elems)
+
+    def __iter__(self):
+        """
+        Yields the elements in increasing order by repeatedly extracting the lowest set bit.
+        :complexity: O(len(self)) big-integer steps
+        """
+        bit_elems = self.elems
+        while bit_elems:
+            lowest = bit_elems & -bit_elems
+            yield lowest.bit_length()
+            bit_elems ^= lowest
 
     def add(self, item: int) -> None:
         """ Adds an element to the set.
@@ -91,12 +105,44 @@ class BSet(Set[int]):
         res.elems = self.elems & ~other.elems
         return res
 
+    def update(self, other: BSet[int]) -> None:
+        """ Adds every element of other to the set, in place. """
+        self.elems |= other.elems
+
+    def intersection_update(self, other: BSet[int]) -> None:
+        """ Keeps only the elements that are also in other, in place. """
+        self.elems &= other.elems
+
+    def difference_update(self, other: BSet[int]) -> None:
+        """ Removes every element of other from the set, in place. """
+        self.elems &= ~other.elems
+
+    def symmetric_difference_update(self, other: BSet[int]) -> None:
+        """ Keeps the elements in exactly one of self and other, in place. """
+        self.elems ^= other.elems
+
     def __and__(self, other: BSet):
         return self.intersection(other)
 
     def __or__(self, other: BSet):
         return self.union(other)
 
+    def __ior__(self, other: BSet):
+        self.update(other)
+        return self
+
+    def __iand__(self, other: BSet):
+        self.intersection_update(other)
+        return self
+
+    def __isub__(self, other: BSet):
+        self.difference_update(other)
+        return self
+
+    def __ixor__(self, other: BSet):
+        self.symmetric_difference_update(other)
+        return self
+
     def __str__(self):
         """ Construct a nice string representation. """
         bit_elems = self.elems
@@ -122,3 +168,25 @@ if __name__ == '__main__':
 
     print(f'S union T = {s.union(t)}')
     print(f'S intersect T = {s.intersection(t)}')
+
+    # Micro-benchmark: len() and iteration of a full 18 element set (the Element enum).
+    import timeit
+    full = BSet()
+    for item in range(1, 19):
+        full.add(item)
+
+    def scan_len():
+        res = 0
+        for item in range(1, int.bit_length(full.elems) + 1):
+            if item in full:
+                res += 1
+        return res
+
+    def scan_iter():
+        return [item for item in range(1, 19) if item in full]
+
+    runs = 100_000
+    print(f'len, per-bit scan:     {timeit.timeit(scan_len, number=runs) / runs * 1e6:.2f} us')
+    print(f'len, popcount:         {timeit.timeit(lambda: len(full), number=runs) / runs * 1e6:.2f} us')
+    print(f'iterate, per-bit scan: {timeit.timeit(scan_iter, number=runs) / runs * 1e6:.2f} us')
+    print(f'iterate, lowest bit:   {timeit.timeit(lambda: list(full), number=runs) / runs * 1e6:.2f} us')
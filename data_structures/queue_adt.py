@@ -110,6 +110,58 @@ class CircularQueue(Queue[T]):
         self.front = 0
         self.rear = 0
 
+    def rotate(self, k: int) -> None:
+        """ Moves the k elements at the front to the rear, keeping their order.
+        :pre: 0 <= k <= len(self)
+        :complexity: O(1) if the array is full, O(k) otherwise
+        """
+        if self.length == len(self.array):
+            self.front = (self.front + k) % len(self.array)
+            self.rear = self.front
+        else:
+            for _ in range(k):
+                self.append(self.serve())
+
+    def reverse_range(self, start: int, stop: int) -> None:
+        """ Reverses, in place, the elements at positions start to stop - 1
+        counted from the front of the queue.
+        :pre: 0 <= start <= stop <= len(self)
+        :complexity: O(stop - start)
+        """
+        capacity = len(self.array)
+        low = start
+        high = stop - 1
+        while low < high:
+            i = (self.front + low) % capacity
+            j = (self.front + high) % capacity
+            self.array[i], self.array[j] = self.array[j], self.array[i]
+            low += 1
+            high -= 1
+
+
+class ResizableCircularQueue(CircularQueue[T]):
+    """ Circular queue that doubles its array when full instead of raising.
+
+    Appends are amortised O(1). is_full is always False.
+    """
+
+    def is_full(self) -> bool:
+        """ A resizable queue is never full. """
+        return False
+
+    def append(self, item: T) -> None:
+        """ Adds an element to the rear of the queue, growing the array if needed. """
+        if self.length == len(self.array):
+            # unwrap into the new array, front first
+            new_array = ArrayR(2 * len(self.array))
+            first = len(self.array) - self.front
+            self.array.copy_into(new_array, first, self.front, 0)
+            self.array.copy_into(new_array, self.length - first, 0, first)
+            self.array = new_array
+            self.front = 0
+            self.rear = self.length
+        CircularQueue.append(self, item)
+
 
 class TestQueue(unittest.TestCase):
     """ Tests for the above class."""
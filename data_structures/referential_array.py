@@ -58,6 +58,25 @@ class ArrayR(Generic[T]):
         """
         self.array[index] = value
 
+    def move(self, source: int, destination: int, count: int) -> None:
+        """Copies the count items starting at source to the count positions
+        starting at destination, as one slice assignment on the underlying
+        ctypes array. The ranges may overlap (memmove semantics).
+        :complexity: O(count), with no per-item Python calls
+        :pre: both ranges lie within the array
+        """
+        if count > 0:
+            self.array[destination:destination + count] = self.array[source:source + count]
+
+    def copy_into(self, other: ArrayR[T], count: int, start: int = 0, other_start: int = 0) -> None:
+        """Copies the count items of this array starting at start into other,
+        starting at other_start, as one slice assignment.
+        :complexity: O(count), with no per-item Python calls
+        :pre: both ranges lie within their arrays
+        """
+        if count > 0:
+            other.array[other_start:other_start + count] = self.array[start:start + count]
+
     def index(self, item: T) -> T:
         for index, arr_item in enumerate(self.array):
             if arr_item == item:
@@ -81,6 +100,12 @@ class ArrayR(Generic[T]):
             ret[x] = l[x]
         return ret
 
+    def __reduce__(self):
+        """Pickles the array by value, as ctypes arrays of references cannot be pickled.
+        :complexity: O(length)
+        """
+        return (ArrayR.from_list, (self.to_list(),))
+
     def to_list(self) -> list[T]:
         ret = []
         for x in range(len(self)):
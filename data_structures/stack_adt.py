@@ -99,6 +99,38 @@ class ArrayStack(Stack[T]):
             raise Exception("Stack is empty")
         return self.array[self.length-1]
 
+    def reverse_top(self, k: int) -> None:
+        """ Reverses the order of the top k elements in place.
+        :pre: 0 <= k <= len(self)
+        :complexity: O(k)
+        """
+        low = self.length - k
+        high = self.length - 1
+        while low < high:
+            self.array[low], self.array[high] = self.array[high], self.array[low]
+            low += 1
+            high -= 1
+
+
+class ResizableArrayStack(ArrayStack[T]):
+    """ Array stack that doubles its array when full instead of raising.
+
+    Pushes are amortised O(1). is_full is always False.
+    """
+
+    def is_full(self) -> bool:
+        """ A resizable stack is never full. """
+        return False
+
+    def push(self, item: T) -> None:
+        """ Pushes an element to the top of the stack, growing the array if needed. """
+        if self.length == len(self.array):
+            new_array = ArrayR(2 * len(self.array))
+            self.array.copy_into(new_array, self.length)
+            self.array = new_array
+        ArrayStack.push(self, item)
+
+
 class TestStack(unittest.TestCase):
     """ Tests for the above class."""
     EMPTY = 0
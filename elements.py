@@ -3,6 +3,8 @@ Student ID: 33326460
 Last Modified: 24/08/2023"""
 from __future__ import annotations
 
+import os
+from array import array
 from enum import auto
 from typing import Optional
 
@@ -55,10 +57,15 @@ class EffectivenessCalculator:
 
     This class follows the singleton pattern.
 
+    The table is read from CSV_PATH the first time it is needed. Set CSV_PATH
+    before then to use another file, or call make_singleton to load it eagerly.
+
     Usage:
         EffectivenessCalculator.get_effectiveness(elem1, elem2)
     """
 
+    CSV_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "type_effectiveness.csv")
+
     instance: Optional[EffectivenessCalculator] = None
 
     def __init__(self, element_names: ArrayR[str], effectiveness_values: ArrayR[float]) -> None: 
@@ -86,6 +93,15 @@ class EffectivenessCalculator:
         for i in range(len(element_names)):
            self.elements[i] = Element.from_string(element_names[i])
 
+        #Dense lookup keyed by Element.value, so lookups skip the index scans
+        #Complexity: O(n*n) worst and best case
+        self.stride = len(Element.__members__) + 1
+        self.lookup = array("d", [0.0]) * (self.stride * self.stride)
+        for i in range(self.elements_number):
+            for j in range(self.elements_number):
+                self.lookup[self.elements[i].value * self.stride + self.elements[j].value] = \
+                    effectiveness_values[i * self.elements_number + j]
+
         if EffectivenessCalculator.instance != None:
             EffectivenessCalculator.instance = self
     
@@ -97,15 +113,29 @@ class EffectivenessCalculator:
         Example: EffectivenessCalculator.get_effectiveness(Element.FIRE, Element.WATER) == 0.5
         Complexity: O(1) worst and best case
         """
-        # cls.instance
-        # cls.type1 = type1
-        # cls.type2 = type2
-        attack_id = cls.instance.elements.index(type1) #get the position for the attack
-        defend_id = cls.instance.elements.index(type2) # get the position for the defend
-        return cls.instance.effectiveness_value[attack_id * cls.instance.elements_number + defend_id] # return the position
-        
-        
-        
+        if cls.instance is None:
+            cls.make_singleton()
+        return cls.instance.lookup[type1.value * cls.instance.stride + type2.value]
+
+    @classmethod
+    def get_effectiveness_many(cls, attackers: array, defenders: array) -> array:
+        """
+        Returns the effectiveness of attackers[i] attacking defenders[i] for every i.
+        Both arguments are sequences of Element values (ints) of the same length.
+
+        Example: EffectivenessCalculator.get_effectiveness_many(array("l", [1]), array("l", [2])) == array("d", [0.5])
+        Complexity: O(n) worst and best case where n is the number of pairs
+        """
+        if len(attackers) != len(defenders):
+            raise ValueError("attackers and defenders should have the same length")
+        if cls.instance is None:
+            cls.make_singleton()
+        lookup = cls.instance.lookup
+        stride = cls.instance.stride
+        result = array("d", [0.0]) * len(attackers)
+        for i in range(len(attackers)):
+            result[i] = lookup[attackers[i] * stride + defenders[i]]
+        return result
 
     @classmethod
     def from_csv(cls, csv_file: str) -> EffectivenessCalculator:
@@ -124,10 +154,9 @@ class EffectivenessCalculator:
             return EffectivenessCalculator(a_header, a_all)
 
     @classmethod
-    def make_singleton(cls):
-        cls.instance = EffectivenessCalculator.from_csv("type_effectiveness.csv")
-
-EffectivenessCalculator.make_singleton()
+    def make_singleton(cls, csv_file: Optional[str] = None):
+        """Load the singleton from csv_file, or CSV_PATH if not given."""
+        cls.instance = EffectivenessCalculator.from_csv(cls.CSV_PATH if csv_file is None else csv_file)
 
 
 if __name__ == "__main__":
@@ -1,4 +1,7 @@
 from __future__ import annotations
+import hashlib
+import os
+import pickle
 import yaml
 from typing import TYPE_CHECKING
 
@@ -8,32 +11,100 @@ if TYPE_CHECKING:
     from monster_base import MonsterBase
 
 
+# The C loader is several times faster, fall back to pure Python if libyaml is missing.
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+ROSTER_CACHE_VERSION = 1
+
+# Where the roster is read from. Loaded lazily, so this can be changed any time before first use.
+MONSTERS_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "monsters.yaml")
+
 _monsters: ArrayR[MonsterBase] = None
+_spawnable: ArrayR[MonsterBase] = None
 
 
 def MonsterBaseFactory(name, description, evolution, element, simple_stats, complex_stats, can_be_spawned) -> type[MonsterBase]:
     from monster_base import MonsterBase
+    from elements import Element
+    # Parsed once here so attacks never have to go back through Element.from_string.
+    element_type = Element.from_string(element)
     return type(name, (MonsterBase, ), {
+        # Registered as helpers.<name> so the classes can be pickled by reference.
+        "__module__": __name__,
+        # No per-instance __dict__, MonsterBase declares the instance slots.
+        "__slots__": (),
         "get_name": classmethod(lambda s: name),
         "get_description": classmethod(lambda s: description),
         # This will be defined later when we have all names.
         "get_evolution": classmethod(lambda s: None),
         "get_element": classmethod(lambda s: element),
+        "get_element_type": classmethod(lambda s: element_type),
         "get_simple_stats": classmethod(lambda s: simple_stats),
         "get_complex_stats": classmethod(lambda s: complex_stats),
         "can_be_spawned": classmethod(lambda s: can_be_spawned),
     })
 
+def preload():
+    """Load the roster and the effectiveness table now rather than on first use."""
+    from elements import EffectivenessCalculator
+    get_all_monsters()
+    if EffectivenessCalculator.instance is None:
+        EffectivenessCalculator.make_singleton()
+
+def __getattr__(name: str):
+    """Monster classes (helpers.Flamikin, ...) are created when the roster is first needed."""
+    if name.startswith("__") or _monsters is not None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    get_all_monsters()
+    if name in globals():
+        return globals()[name]
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 def get_all_monsters():
     if _monsters is None:
         _make_all_monster_classes()
     return _monsters
 
+def get_spawnable_monsters():
+    """The spawnable monster classes, in get_all_monsters() order. Built once with the roster."""
+    if _spawnable is None:
+        _make_all_monster_classes()
+    return _spawnable
+
+def _load_roster(path: str) -> list[dict]:
+    """
+    Return the parsed roster YAML.
+
+    The parsed data is pickled to <path>.cache together with the SHA-256 of the
+    YAML source, and reused while the source is unchanged. Failing to write the
+    cache is not an error.
+    """
+    with open(path, "rb") as f:
+        source = f.read()
+    digest = hashlib.sha256(source).hexdigest()
+    cache_path = path + ".cache"
+    try:
+        with open(cache_path, "rb") as f:
+            version, cached_digest, monsters_yaml = pickle.load(f)
+        if version == ROSTER_CACHE_VERSION and cached_digest == digest:
+            return monsters_yaml
+    except (OSError, pickle.UnpicklingError, EOFError, ValueError, TypeError):
+        pass
+
+    monsters_yaml = yaml.load(source, Loader=_YamlLoader)
+    try:
+        tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump((ROSTER_CACHE_VERSION, digest, monsters_yaml), f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+    return monsters_yaml
+
 def _make_all_monster_classes():
     from stats import SimpleStats, ComplexStats
-    global _monsters
-    with open("monsters.yaml", "r") as f:
-        monsters_yaml = yaml.safe_load(f)
+    global _monsters, _spawnable
+    monsters_yaml = _load_roster(MONSTERS_PATH)
     _monsters = ArrayR(len(monsters_yaml))
     idx = 0
     for monster in monsters_yaml:
@@ -64,8 +135,17 @@ def _make_all_monster_classes():
         evolution_class = globals()[evolution]
         globals()[monster["name"]].evolution_class = evolution_class
         globals()[monster["name"]].get_evolution = classmethod(lambda s: s.evolution_class)
-
-get_all_monsters()
+    # Index of the spawnable classes, so random selection is O(1) per pick.
+    n_spawnable = 0
+    for x in range(len(_monsters)):
+        if _monsters[x].can_be_spawned():
+            n_spawnable += 1
+    _spawnable = ArrayR(n_spawnable)
+    idx = 0
+    for x in range(len(_monsters)):
+        if _monsters[x].can_be_spawned():
+            _spawnable[idx] = _monsters[x]
+            idx += 1
 
 if TYPE_CHECKING:
     # Makes no sense but fixes the red squigglies
@@ -112,3 +192,18 @@ if TYPE_CHECKING:
     Treetower = MonsterBase
     Venomcoil = MonsterBase
     Vineon = MonsterBase
+
+if __name__ == "__main__":
+    # Startup benchmark: parsing the roster vs. loading the compiled cache.
+    import timeit
+
+    with open(MONSTERS_PATH, "rb") as f:
+        source = f.read()
+    runs = 20
+    safe = timeit.timeit(lambda: yaml.load(source, Loader=yaml.SafeLoader), number=runs) / runs
+    fast = timeit.timeit(lambda: yaml.load(source, Loader=_YamlLoader), number=runs) / runs
+    _load_roster(MONSTERS_PATH)
+    cached = timeit.timeit(lambda: _load_roster(MONSTERS_PATH), number=runs) / runs
+    print(f"yaml.SafeLoader:   {safe * 1000:.2f} ms")
+    print(f"{_YamlLoader.__name__ + ':':18} {fast * 1000:.2f} ms")
+    print(f"roster cache:      {cached * 1000:.2f} ms ({safe / cached:.0f}x faster than SafeLoader)")
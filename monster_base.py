@@ -7,6 +7,11 @@ import math
 from stats import Stats
 
 class MonsterBase(abc.ABC):
+
+    # Only per-instance state lives on the instance. Stats, element and
+    # evolution are class-level data reached through the factory classmethods.
+    __slots__ = ("simple_mode", "level", "level_current", "max_hp", "current_hp")
+
     def __init__(self, simple_mode=True, level:int=1) -> None:
         """
         Initialise an instance of a monster.
@@ -19,20 +24,9 @@ class MonsterBase(abc.ABC):
         self.level_current = level # keep the intital level 
        
         #Complexity: O(1) worst and best case
-        #Access to the methods
-        self.evolution = self.get_evolution()
-        self.stats = self.get_simple_stats()
-        self.elements = self.get_element()
-
-        #Access to the simple_stats
         self.max_hp = self.get_max_hp()
         self.current_hp = self.max_hp
 
-        self.speed = self.stats.get_speed()
-        self.attack_mons = self.stats.get_attack()
-        self.defense = self.stats.get_defense()
-        
-
     def get_level(self): #Complexity: O(1) worst and best case
         """The current level of this monster instance"""
         return self.level
@@ -40,10 +34,22 @@ class MonsterBase(abc.ABC):
     def level_up(self): #Complexity: O(1) worst and best case
         """Increase the level of this monster instance by 1"""
         self.level +=1
-        self.lost_hp = self.max_hp - self.current_hp
-        self.current_hp = self.get_max_hp() - self.lost_hp
+        lost_hp = self.max_hp - self.current_hp
+        self.current_hp = self.get_max_hp() - lost_hp
         self.max_hp = self.get_max_hp()
         
+    def reset(self): #Complexity: O(1) worst and best case
+        """
+        Return this instance to its starting level with full HP, as if newly created.
+
+        __init__ is not run again, only the state it sets here is restored.
+        Subclasses that set more state in __init__ should override reset and
+        call MonsterBase.reset, since MonsterTeam.regenerate_team reuses instances.
+        """
+        self.level = self.level_current
+        self.max_hp = self.get_max_hp()
+        self.current_hp = self.max_hp
+
     def get_hp(self): #Complexity: O(1) worst and best case
         """Get the current HP of this monster instance"""
         return self.current_hp
@@ -55,22 +61,26 @@ class MonsterBase(abc.ABC):
     def get_attack(self): #Complexity: O(1) worst and best case
         """Get the attack of this monster instance"""
         if self.simple_mode == True:
-            return self.attack_mons
+            return self.get_simple_stats().get_attack()
+        return self.get_complex_stats().get_attack(self.level)
 
     def get_defense(self): #Complexity: O(1) worst and best case
         """Get the defense of this monster instance"""
         if self.simple_mode == True:
-            return self.defense
+            return self.get_simple_stats().get_defense()
+        return self.get_complex_stats().get_defense(self.level)
 
     def get_speed(self): #Complexity: O(1) worst and best case
         """Get the speed of this monster instance"""
         if self.simple_mode == True:
-            return self.speed
+            return self.get_simple_stats().get_speed()
+        return self.get_complex_stats().get_speed(self.level)
 
     def get_max_hp(self): #Complexity: O(1) worst and best case
         """Get the maximum HP of this monster instance"""
         if self.simple_mode == True:
-            return self.stats.get_max_hp()
+            return self.get_simple_stats().get_max_hp()
+        return self.get_complex_stats().get_max_hp(self.level)
 
 
     def alive(self) -> bool: #Complexity: O(1) worst and best case
@@ -84,8 +94,8 @@ class MonsterBase(abc.ABC):
         #Step 1: Compute attack stat vs. defense stat
         defense_var = other.get_defense() #Complexity: O(1) worst and best case
         attack_var = self.get_attack() #Complexity: O(1) worst and best case
-        own_element = Element.from_string(self.get_element())
-        enemy_element = Element.from_string(other.get_element())
+        own_element = self.get_element_type()
+        enemy_element = other.get_element_type()
 
         # Step 2: Apply type effectiveness
         if defense_var < attack_var / 2:
@@ -160,6 +170,14 @@ class MonsterBase(abc.ABC):
         """
         pass
 
+    @classmethod
+    def get_element_type(cls) -> Element:
+        """
+        Returns the element of the Monster as an Element member.
+        The factory overrides this with the member parsed when the class is built.
+        """
+        return Element.from_string(cls.get_element())
+
     @classmethod
     @abc.abstractmethod
     def can_be_spawned(cls) -> bool:
@@ -186,3 +204,21 @@ class MonsterBase(abc.ABC):
         Same for all monsters of the same type.
         """
         pass
+
+
+if __name__ == "__main__":
+    # Memory benchmark: factory (slotted) instances vs. a subclass that keeps a __dict__.
+    import tracemalloc
+    from helpers import Flamikin
+
+    class DictFlamikin(Flamikin):
+        pass
+
+    n = 100_000
+    for cls in (Flamikin, DictFlamikin):
+        tracemalloc.start()
+        monsters = [cls() for _ in range(n)]
+        size, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        print(f"{cls.__name__}: {size / n:.0f} bytes per instance")
+        del monsters
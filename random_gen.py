@@ -4,6 +4,7 @@ Random number generator class. Uses LCG method with some reasonable initialisati
 __author__ = "Jackson Goerner"
 
 import time
+from array import array
 
 class RandomGen():
     """
@@ -17,6 +18,9 @@ class RandomGen():
     RandomGen.random()            # Random number from 0 to 2^32-1
     RandomGen.randint(1, 10)     # Random number from 1 to 10
     RandomGen.random_chance(0.33) # True 33% of the time, False 67% of the time.
+    RandomGen.randints(1, 10, 5)  # array of 5 random numbers from 1 to 10, same as 5 randint calls
+    RandomGen.skip(1000)          # Same as calling random() 1000 times, in O(log 1000)
+    stream = RandomGen.stream(3)  # Independent generator for the 4th substream
     ```
     """
 
@@ -24,6 +28,11 @@ class RandomGen():
     A = 25214903917
     C = 11
 
+    # Number of draws in each substream handed out by stream(), and how many
+    # non-overlapping substreams fit in one period of the LCG.
+    STREAM_SPACING = pow(2, 20)
+    STREAM_COUNT = MOD // STREAM_SPACING
+
     seed = time.time_ns()
 
     @classmethod
@@ -32,31 +41,90 @@ class RandomGen():
         seed = time.time_ns() if seed is None else seed
         cls.seed = seed
 
+    @classmethod
+    def jump(cls, seed, n):
+        """
+        Returns the state reached from `seed` after `n` steps of the LCG.
+        Composes the affine map x -> A*x + C with itself by repeated squaring.
+        :complexity: O(log n)
+        """
+        step_a, step_c = cls.A, cls.C
+        total_a, total_c = 1, 0
+        while n > 0:
+            if n & 1:
+                total_a = (step_a * total_a) % cls.MOD
+                total_c = (step_a * total_c + step_c) % cls.MOD
+            step_c = ((step_a + 1) * step_c) % cls.MOD
+            step_a = (step_a * step_a) % cls.MOD
+            n >>= 1
+        return (total_a * seed + total_c) % cls.MOD
+
+    @classmethod
+    def skip(cls, n):
+        """
+        Advances the global state as if `random` had been called `n` times.
+        :complexity: O(log n)
+        """
+        cls.seed = cls.jump(cls.seed, n)
+
+    @classmethod
+    def stream(cls, i, seed=None):
+        """
+        Returns a RandomStream for substream `i` of the sequence starting at `seed`
+        (the current global seed if not given).
+
+        Substream i starts i * STREAM_SPACING draws into the sequence. Streams
+        do not overlap as long as none draws more than STREAM_SPACING numbers,
+        and stream(0) replays exactly what RandomGen itself would produce.
+        :raises ValueError: if i is not in range(STREAM_COUNT), as the sequence wraps around.
+        :complexity: O(log i)
+        """
+        if not 0 <= i < cls.STREAM_COUNT:
+            raise ValueError(f"Substream {i} is out of range, there are {cls.STREAM_COUNT}")
+        seed = cls.seed if seed is None else seed
+        return RandomStream(cls.jump(seed, i * cls.STREAM_SPACING))
+
     @classmethod
     def random(cls):
         """Returns a random integer from 0 to 2^32-1"""
         cls.seed = (cls.A * cls.seed + cls.C) % cls.MOD
         return cls.seed >> 16
 
+    @classmethod
+    def random_block(cls, count):
+        """
+        Returns an array('Q') with the next `count` values of `random`, in order.
+        :complexity: O(count)
+        """
+        return RandomStream.random_block(cls, count)
+
+    @classmethod
+    def randints(cls, lo, hi, count):
+        """
+        Returns an array('q') with the next `count` values of `randint(lo, hi)`, in order.
+        :complexity: O(count)
+        """
+        return RandomStream.randints(cls, lo, hi, count)
+
     @classmethod
     def random_float(cls):
         """Returns a random floating point integer in the range 0 to 1."""
-        return cls.random() / (1 << 32)
+        return RandomStream.random_float(cls)
 
     @classmethod
     def randint(cls, lo, hi):
         """Returns a random integer from `lo` to `hi` inclusive on both ends."""
-        return (cls.random() % (hi - lo + 1)) + lo
+        return RandomStream.randint(cls, lo, hi)
 
     @classmethod
     def random_chance(cls, ratio):
         """Returns random()/2^32 < ratio"""
-        return cls.random_float() < ratio
+        return RandomStream.random_chance(cls, ratio)
 
     @classmethod
     def random_choice(cls, collection) -> None:
         """Returns a random choice from a collection that supports __getitem__ and __len__"""
-        return collection[cls.randint(0, len(collection)-1)]
+        return RandomStream.random_choice(cls, collection)
 
     @classmethod
     def random_shuffle(cls, collection) -> None:
@@ -64,8 +132,77 @@ class RandomGen():
         Randomly shuffles a collection that supports __getitem__, __setitem__ and __len__
         :complexity: O(len(collection))
         """
-        positions = [(RandomGen.random(), i) for i in range(len(collection))]
+        positions = [(value, i) for i, value in enumerate(cls.random_block(len(collection)))]
         positions.sort() # I can use inbuilt list sorting here - YOU CANNOT ANYWHERE ELSE! >:D
         tmp = [collection[p[1]] for p in positions]
         for x in range(len(collection)):
             collection[x] = tmp[x]
+
+
+class RandomStream():
+    """
+    Instance-based generator over the same LCG as RandomGen (same A, C and MOD).
+
+    Each instance owns its state, so several can be used side by side without
+    touching the global RandomGen seed. Create them with RandomGen.stream(i).
+    All methods are O(1) best/worst case time complexity unless stated otherwise.
+
+    The drawing methods only use `seed` and `random`, so RandomGen reuses them
+    with the class itself in place of an instance.
+    """
+
+    def __init__(self, seed) -> None:
+        self.seed = seed
+
+    def skip(self, n):
+        """
+        Advances this stream as if `random` had been called `n` times.
+        :complexity: O(log n)
+        """
+        self.seed = RandomGen.jump(self.seed, n)
+
+    def random(self):
+        """Returns a random integer from 0 to 2^32-1"""
+        self.seed = (RandomGen.A * self.seed + RandomGen.C) % RandomGen.MOD
+        return self.seed >> 16
+
+    def random_block(self, count):
+        """
+        Returns an array('Q') with the next `count` values of `random`, in order.
+        :complexity: O(count)
+        """
+        block = array("Q", bytes(8 * count))
+        a, c, mod, seed = RandomGen.A, RandomGen.C, RandomGen.MOD, self.seed
+        for i in range(count):
+            seed = (a * seed + c) % mod
+            block[i] = seed >> 16
+        self.seed = seed
+        return block
+
+    def randints(self, lo, hi, count):
+        """
+        Returns an array('q') with the next `count` values of `randint(lo, hi)`, in order.
+        :complexity: O(count)
+        """
+        span = hi - lo + 1
+        block = self.random_block(count)
+        result = array("q", bytes(8 * count))
+        for i in range(count):
+            result[i] = block[i] % span + lo
+        return result
+
+    def random_float(self):
+        """Returns a random floating point integer in the range 0 to 1."""
+        return self.random() / (1 << 32)
+
+    def randint(self, lo, hi):
+        """Returns a random integer from `lo` to `hi` inclusive on both ends."""
+        return (self.random() % (hi - lo + 1)) + lo
+
+    def random_chance(self, ratio):
+        """Returns random()/2^32 < ratio"""
+        return self.random_float() < ratio
+
+    def random_choice(self, collection):
+        """Returns a random choice from a collection that supports __getitem__ and __len__"""
+        return collection[self.randint(0, len(collection)-1)]
@@ -0,0 +1,126 @@
+from __future__ import annotations
+import abc
+import csv
+import json
+from array import array
+from typing import Iterator, TextIO
+
+
+class ResultSink(abc.ABC):
+    """
+    Destination for compact tower result rows, see BattleTower.stream_results.
+
+    A row is a tuple of ints in FIELDS order: battle index, Battle.Result value,
+    the player's lives, the enemy team's lives, the enemy team id and the
+    number of turns. Rows are buffered and handed to write_batch BATCH_SIZE at
+    a time, so file sinks do one sequential write per batch.
+    """
+
+    FIELDS = ("battle", "result", "lives", "enemy_lives", "enemy_id", "turns")
+    BATCH_SIZE = 1024
+
+    def __init__(self, batch_size: int = BATCH_SIZE) -> None:
+        """Create an empty batch
+        Complexity O(1) for best and worst case"""
+        self.batch_size = batch_size
+        self.batch = []
+
+    def write(self, row: tuple[int, ...]) -> None:
+        """Buffer one row, flushing when the batch is full
+        Complexity O(1) amortised for best and worst case"""
+        self.batch.append(row)
+        if len(self.batch) >= self.batch_size:
+            self.flush()
+
+    def flush(self) -> None:
+        """Hand the buffered rows to write_batch
+        Complexity O(n) for best and worst case where n is the batch size"""
+        if self.batch:
+            self.write_batch(self.batch)
+            self.batch = []
+
+    @abc.abstractmethod
+    def write_batch(self, rows: list[tuple[int, ...]]) -> None:
+        """Store a batch of rows"""
+        pass
+
+    def close(self) -> None:
+        """Flush any buffered rows
+        Complexity O(n) for best and worst case where n is the batch size"""
+        self.flush()
+
+    def __enter__(self) -> ResultSink:
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class ArraySink(ResultSink):
+    """Rows kept in memory in a flat array of ints, len(FIELDS) per row."""
+
+    def __init__(self) -> None:
+        """Create an empty sink
+        Complexity O(1) for best and worst case"""
+        ResultSink.__init__(self)
+        self.values = array("q")
+
+    def write(self, row: tuple[int, ...]) -> None:
+        """Append a row straight to the array; there is nothing to batch
+        Complexity O(1) amortised for best and worst case"""
+        self.values.extend(row)
+
+    def write_batch(self, rows: list[tuple[int, ...]]) -> None:
+        for row in rows:
+            self.values.extend(row)
+
+    def __len__(self) -> int:
+        return len(self.values) // len(self.FIELDS)
+
+    def __getitem__(self, index: int) -> tuple[int, ...]:
+        """The row at index
+        Complexity O(1) for best and worst case"""
+        if not 0 <= index < len(self):
+            raise IndexError("Result row index out of range")
+        width = len(self.FIELDS)
+        return tuple(self.values[index * width:(index + 1) * width])
+
+    def __iter__(self) -> Iterator[tuple[int, ...]]:
+        for i in range(len(self)):
+            yield self[i]
+
+
+class FileSink(ResultSink):
+    """Base for sinks writing text rows to a file, which they own and close."""
+
+    def __init__(self, path: str, batch_size: int = ResultSink.BATCH_SIZE) -> None:
+        """Open path for writing, replacing any existing file
+        Complexity O(1) for best and worst case"""
+        ResultSink.__init__(self, batch_size)
+        self.file: TextIO = open(path, "w", newline="")
+
+    def close(self) -> None:
+        """Flush and close the file
+        Complexity O(n) for best and worst case where n is the batch size"""
+        ResultSink.close(self)
+        if not self.file.closed:
+            self.file.close()
+
+
+class CsvSink(FileSink):
+    """Rows written as CSV, with a header line of FIELDS."""
+
+    def __init__(self, path: str, batch_size: int = ResultSink.BATCH_SIZE) -> None:
+        FileSink.__init__(self, path, batch_size)
+        self.writer = csv.writer(self.file)
+        self.writer.writerow(self.FIELDS)
+
+    def write_batch(self, rows: list[tuple[int, ...]]) -> None:
+        self.writer.writerows(rows)
+
+
+class JsonlSink(FileSink):
+    """Rows written as one JSON object per line, keyed by FIELDS."""
+
+    def write_batch(self, rows: list[tuple[int, ...]]) -> None:
+        self.file.write("".join(json.dumps(dict(zip(self.FIELDS, row))) + "\n" for row in rows))
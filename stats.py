@@ -2,6 +2,7 @@
 Student ID: 33326460
 Last Modified: 24/08/2023"""
 import abc
+from functools import lru_cache
 
 from data_structures.referential_array import ArrayR
 from data_structures.stack_adt import ArrayStack
@@ -65,6 +66,8 @@ class SimpleStats(Stats):
 
 class ComplexStats(Stats):
 
+    LEVEL_CACHE_SIZE = 32
+
     def __init__(
         self,
         attack_formula: ArrayR[str],
@@ -80,31 +83,108 @@ class ComplexStats(Stats):
         self.speed_formula = speed_formula
         self.max_hp_formula = max_hp_formula
 
+        #Compile each formula once, then memoise the values per level
+        #Complexity: O(n) for best and worst case where n is the total formula length
+        self.attack_at = lru_cache(maxsize=self.LEVEL_CACHE_SIZE)(self.compile_formula(attack_formula))
+        self.defense_at = lru_cache(maxsize=self.LEVEL_CACHE_SIZE)(self.compile_formula(defense_formula))
+        self.speed_at = lru_cache(maxsize=self.LEVEL_CACHE_SIZE)(self.compile_formula(speed_formula))
+        self.max_hp_at = lru_cache(maxsize=self.LEVEL_CACHE_SIZE)(self.compile_formula(max_hp_formula))
+
     def get_attack(self, level: int): 
         """Return the attack of the complex stats 
         No input
         Return: defense       
         """
-        return self.calculate_formula(self.attack_formula,level)    
+        return self.attack_at(level)
     def get_defense(self, level: int): 
         """Return the defense of the complex stats 
         No input
         Return: defense      
         """
-        return self.calculate_formula(self.defense_formula,level)   
+        return self.defense_at(level)
      
     def get_speed(self, level: int):  
         """Return the speed of the complex stats 
         No input
         Return: speed       
         """
-        return self.calculate_formula(self.speed_formula,level)    
+        return self.speed_at(level)
     def get_max_hp(self, level: int):    
        """Return the max_hp of the complex stats 
         No input
         Return: speed       
         """
-       return self.calculate_formula(self.max_hp_formula,level)     
+       return self.max_hp_at(level)
+
+    def compile_formula(self, formula: ArrayR[str]):
+        """Compile a Polish notation formula into a function of the level
+        Input: the formula tokens
+        Return: a function taking the level and returning the same value as calculate_formula
+        Sub-expressions without "level" are folded into constants.
+        Complexity: O(n) for best and worst case where n is the formula length
+        """
+        # Each stack entry is (is_constant, value or function of the level)
+        stored = ArrayStack(len(formula))
+
+        for element in formula:
+            if element == "level":
+                stored.push((False, lambda level: level))
+
+            elif element == "sqrt":
+                stored.push(self._compile_apply(self.square_roorts, stored.pop()))
+
+            elif element == "middle":
+                num1 = stored.pop()
+                num2 = stored.pop()
+                num3 = stored.pop()
+                stored.push(self._compile_apply(self.median, num1, num2, num3))
+
+            elif element == "+":
+                num2 = stored.pop()
+                num1 = stored.pop()
+                stored.push(self._compile_apply(lambda a, b: b + a, num1, num2))
+
+            elif element == "-":
+                num2 = stored.pop()
+                num1 = stored.pop()
+                stored.push(self._compile_apply(lambda a, b: a - b, num1, num2))
+
+            elif element == "/":
+                num2 = stored.pop()
+                num1 = stored.pop()
+                stored.push(self._compile_apply(lambda a, b: a / b, num1, num2))
+
+            elif element == "*":
+                num2 = stored.pop()
+                num1 = stored.pop()
+                stored.push(self._compile_apply(lambda a, b: a * b, num1, num2))
+
+            elif element == "power":
+                num2 = stored.pop()
+                num1 = stored.pop()
+                stored.push(self._compile_apply(lambda a, b: a ** b, num1, num2))
+            else:
+                stored.push((True, int(element)))
+
+        is_constant, value = stored.pop()
+        if is_constant:
+            return lambda level: value
+        return value
+
+    def _compile_apply(self, operation, *operands):
+        """Combine compiled operands with an operation, folding it if every operand is constant
+        Complexity: O(1) for best and worst case
+        """
+        if all(is_constant for is_constant, _ in operands):
+            return (True, operation(*[value for _, value in operands]))
+        functions = [value if not is_constant else (lambda level, value=value: value) for is_constant, value in operands]
+        if len(functions) == 1:
+            f = functions[0]
+            return (False, lambda level: operation(f(level)))
+        if len(functions) == 2:
+            f, g = functions
+            return (False, lambda level: operation(f(level), g(level)))
+        return (False, lambda level: operation(*[f(level) for f in functions]))
     
     def calculate_formula(self, formula:ArrayR[str], level_num: int) -> int:  
         """Calculate and return the calculated attack,speed,get_max_hp,speed in complex stats via those input in Polish notation
@@ -180,6 +260,12 @@ class ComplexStats(Stats):
         num1 = list.pop()
         num2 = list.pop()
         num3 = list.pop()
+        return self.median(num1, num2, num3)
+
+    def median(self, num1, num2, num3):
+        """Return the median of three numbers, ties resolved as in middle
+        Complexity: O(1) for best and worst case
+        """
         if (num1 < num2 and num1 > num3) or (num1 < num3 and num1 > num2):
             median = num1
         elif (num2 < num3 and num2 > num1) or (num2 < num1 and num2 > num3):
@@ -1,14 +1,15 @@
 from __future__ import annotations
+from array import array
 from enum import auto
 from typing import Optional, TYPE_CHECKING
 
 from base_enum import BaseEnum
 from monster_base import MonsterBase
 from random_gen import RandomGen
-from helpers import get_all_monsters
+from helpers import get_all_monsters, get_spawnable_monsters
 
-from data_structures.stack_adt import ArrayStack
-from data_structures.queue_adt import CircularQueue
+from data_structures.stack_adt import ArrayStack, ResizableArrayStack
+from data_structures.queue_adt import CircularQueue, ResizableCircularQueue
 from data_structures.array_sorted_list import ArraySortedList
 from data_structures.sorted_list_adt import ListItem
 from data_structures.referential_array import ArrayR
@@ -52,16 +53,29 @@ class MonsterTeam:
         self.team_mode = team_mode
         self.key = kwargs.get('sort_key') #key
         self.prov_mons = kwargs.get('provided_monsters') #listed of Monster
-        self.init_team = ArrayR(self.TEAM_LIMIT)
+        self.team_limit = kwargs.get('team_limit') or self.TEAM_LIMIT
+        # The monster instances the team started with, in selection order, reset in place by regenerate_team.
+        # Allocated by the selection method once the team size is known.
+        self.snapshot = None
+        self.snapshot_size = 0
         self.memory_key = -1
+        self.spec = None
         self.team_task5 = BSet(len(Element.__members__))
 
-        if self.team_mode == self.TeamMode.FRONT: #Stack Ideas
-            self.team = ArrayStack(self.TEAM_LIMIT)
+        # Large teams start small and grow, instead of preallocating the whole limit
+        if self.team_limit > self.TEAM_LIMIT:
+            if self.team_mode == self.TeamMode.FRONT: #Stack Ideas
+                self.team = ResizableArrayStack(self.TEAM_LIMIT)
+            elif self.team_mode == self.TeamMode.BACK: # Circular Queue Ideas
+                self.team = ResizableCircularQueue(self.TEAM_LIMIT)
+            elif self.team_mode == self.TeamMode.OPTIMISE: #Sorted list resizes on its own
+                self.team = ArraySortedList(self.TEAM_LIMIT)
+        elif self.team_mode == self.TeamMode.FRONT: #Stack Ideas
+            self.team = ArrayStack(self.team_limit)
         elif self.team_mode == self.TeamMode.BACK: # Circular Queue Ideas
-            self.team = CircularQueue(self.TEAM_LIMIT)
+            self.team = CircularQueue(self.team_limit)
         elif self.team_mode == self.TeamMode.OPTIMISE: #Sorted listed ideas
-            self.team = ArraySortedList(self.TEAM_LIMIT)
+            self.team = ArraySortedList(self.team_limit)
 
         if selection_mode == self.SelectionMode.RANDOM:
             self.select_randomly()
@@ -69,7 +83,6 @@ class MonsterTeam:
             self.select_manually()
         elif selection_mode == self.SelectionMode.PROVIDED:
             self.select_provided(self.prov_mons)
-            self.init_team = self.prov_mons
         else:
             raise ValueError(f"selection_mode {selection_mode} not supported.") 
     
@@ -97,7 +110,7 @@ class MonsterTeam:
         Return: the length of the  team
         Complexity O(log(n)) for best and worst case where n is the team size     
         """
-        if self.team.is_full():
+        if len(self.team) >= self.team_limit:
             return
         if self.team_mode == self.TeamMode.FRONT: #Stack Ideas
             self.team.push(monster)
@@ -143,87 +156,96 @@ class MonsterTeam:
         Return: the new positon of the monster
         Complexity O(n) for best and worst case where n is the team size
         """
-        newStack = ArrayStack(self.TEAM_LIMIT)
-        newQueue = CircularQueue(self.TEAM_LIMIT)
         if self.team_mode == self.TeamMode.FRONT: #Stack Ideas
-            if len(self.team) == 2:
-                for _ in range(2):
-                    newQueue.append(self.retrieve_from_team())
-            elif len(self.team) >=3: 
-                for _ in range(3):
-                    newQueue.append(self.retrieve_from_team())
-                
-            for _ in range(len(newQueue)):
-                self.add_to_team(newQueue.serve())
-        
-        elif self.team_mode == self.TeamMode.BACK: # Circular Queue Ideas
-            mid = (len(self.team))/2
-            for i in range(len(self.team)): 
-                if i <= mid-1:
-                    newQueue.append(self.retrieve_from_team())
-                else:
-                    newStack.push(self.retrieve_from_team())
-            for _ in range(len(newStack)):
-                self.add_to_team(newStack.pop())
-            for _ in range(len(newQueue)): 
-                self.add_to_team(newQueue.serve())
+            # Reverse the top (up to) 3 in place
+            if len(self.team) >= 2:
+                self.team.reverse_top(min(3, len(self.team)))
 
+        elif self.team_mode == self.TeamMode.BACK: # Circular Queue Ideas
+            # Reverse the back half, then move the front half behind it
+            half = len(self.team) // 2
+            self.team.reverse_range(half, len(self.team))
+            self.team.rotate(half)
 
         elif self.team_mode == self.TeamMode.OPTIMISE:
             self.memory_key = -self.memory_key
-            for _ in range(len(self.team)):
-                mons = self.team.delete_at_index(0)
-                mons.key = -(mons.key)
-                self.team.add(mons)
+            self.team.reverse() # same order as re-adding each monster with its key negated
             
     def regenerate_team(self) -> None:
-        """Do action revelant to the team mode
+        """Restore the team to its initial state
+        The snapshot instances are reset in place and re-added in their original
+        order, so no containers or monsters are allocated.
         No input
         Return: the initial team
         Complexity O(n) for best and worst case where n is the initial team size
         """
-        if self.team_mode == self.TeamMode.FRONT: #Stack Ideas
-            self.team = ArrayStack(self.TEAM_LIMIT)
-        elif self.team_mode == self.TeamMode.BACK: # Circular Queue Ideas
-            self.team = CircularQueue(self.TEAM_LIMIT)
-        elif self.team_mode == self.TeamMode.OPTIMISE: #Sorted listed ideas
-            self.team = ArraySortedList(self.TEAM_LIMIT)
+        self.team.clear()
+        if self.team_mode == self.TeamMode.OPTIMISE:
             self.memory_key = -1
-        for i in range(len(self.init_team)):
-            if self.init_team[i] != None:
-                self.add_to_team(self.init_team[i]())
+        for i in range(self.snapshot_size):
+            monster = self.snapshot[i]
+            monster.reset()
+            self.add_to_team(monster)
+
+    def to_spec(self) -> TeamSpec:
+        """A PROVIDED TeamSpec that rebuilds this team as it started
+        The monster classes are read from the snapshot once and the spec is reused after that.
+        Complexity O(n) for the first call and O(1) after, where n is the initial team size
+        """
+        if self.spec is None:
+            classes = ArrayR(self.snapshot_size)
+            for i in range(self.snapshot_size):
+                classes[i] = type(self.snapshot[i])
+            self.spec = TeamSpec(self.team_mode, self.SelectionMode.PROVIDED, classes, self.key, self.team_limit)
+        return self.spec
+
+    def _spawn(self, monster_class: type[MonsterBase]) -> MonsterBase:
+        """Create a monster, record it in the snapshot and add it to the team
+        Complexity O(log(n)) for best and worst case where n is the team size
+        """
+        monster = monster_class()
+        self.snapshot[self.snapshot_size] = monster
+        self.snapshot_size += 1
+        self.add_to_team(monster)
+        return monster
+
+    @classmethod
+    def random_picks(cls, team_limit: Optional[int] = None) -> array:
+        """Draw a random team as indices into get_spawnable_monsters()
+        Consumes RandomGen exactly as select_randomly does, which spawns these picks in order.
+        Complexity O(n) for best and worst case where n is the team size
+        """
+        team_size = RandomGen.randint(1, team_limit or cls.TEAM_LIMIT)
+        spawnable = get_spawnable_monsters()
+        if len(spawnable) == 0:
+            raise ValueError("Spawning logic failed.")
+        return RandomGen.randints(0, len(spawnable)-1, team_size)
+
+    @classmethod
+    def from_picks(cls, team_mode: TeamMode, picks: array, team_limit: Optional[int] = None) -> MonsterTeam:
+        """The team select_randomly builds from random_picks, without drawing from RandomGen
+        Complexity O(n) for best and worst case where n is the team size
+        """
+        spawnable = get_spawnable_monsters()
+        provided = ArrayR(len(picks))
+        for i in range(len(picks)):
+            provided[i] = spawnable[picks[i]]
+        return cls(team_mode, cls.SelectionMode.PROVIDED, provided_monsters=provided, team_limit=team_limit)
 
     def select_randomly(self):
         """Select the random monster to add to team
         No input
         Return: the initial team
-        Complexity O(comp) for best and worst case
+        Complexity O(n) for best and worst case where n is the team size
         """
-        team_size = RandomGen.randint(1, self.TEAM_LIMIT)
-        monsters = get_all_monsters()
-        n_spawnable = 0
-        for x in range(len(monsters)):
-            if monsters[x].can_be_spawned():
-                n_spawnable += 1
-
-        i = 0
-        for _ in range(team_size):
-            spawner_index = RandomGen.randint(0, n_spawnable-1)
-            cur_index = -1
-            for x in range(len(monsters)):
-                if monsters[x].can_be_spawned():
-                    cur_index += 1
-                    if cur_index == spawner_index:
-                        # Spawn this monster
-                        self.init_team[i] = monsters[x]
-                        i += 1
-                        element = Element.from_string(monsters[x].get_element())
-                        self.team_task5.add(element.value)
-                        self.add_to_team(monsters[x]())
-                        
-                        break
-            else:
-                raise ValueError("Spawning logic failed.")
+        spawnable = get_spawnable_monsters()
+        picks = self.random_picks(self.team_limit)
+        self.snapshot = ArrayR(len(picks))
+        for i in range(len(picks)):
+            # Spawn this monster
+            monster = spawnable[picks[i]]
+            self.team_task5.add(monster.get_element_type().value)
+            self._spawn(monster)
 
     def select_manually(self):
         """
@@ -333,7 +355,7 @@ class MonsterTeam:
         while True: 
             try:
                 team_amount = int(input(" Team size. Single integer: "))
-                if team_amount <= self.TEAM_LIMIT and team_amount >=1:
+                if team_amount <= self.team_limit and team_amount >=1:
                     break
                 else:
                     print("Invalid input")
@@ -342,7 +364,7 @@ class MonsterTeam:
     
         print(f"How many monsters are there? {team_amount} \n Monster are: \n")
         manually_list = get_all_monsters()
-        i = 0
+        self.snapshot = ArrayR(team_amount)
         for man_mons in range(len(manually_list)):
             if manually_list[man_mons].can_be_spawned() == "✔️":
                 print(f"{man_mons+1}: {manually_list[man_mons].get_name()} [✔️]")
@@ -354,9 +376,7 @@ class MonsterTeam:
                 choose_mons = int(input("Which monster are you spawning? "))
                 if choose_mons <= len(manually_list) and choose_mons >=1:
                     if manually_list[choose_mons-1].can_be_spawned():
-                        self.init_team[i] =  manually_list[choose_mons-1]
-                        i+=1
-                        self.add_to_team(manually_list[choose_mons-1]())
+                        self._spawn(manually_list[choose_mons-1])
                         break
                     else:
                         print("This monster cannot be spawned.")
@@ -387,13 +407,13 @@ class MonsterTeam:
         """
         if provided_monsters is None:
             raise ValueError("No provided List")
-        if len(provided_monsters) > self.TEAM_LIMIT:
+        if len(provided_monsters) > self.team_limit:
             raise ValueError
+        self.snapshot = ArrayR(len(provided_monsters))
         for prov_mons in provided_monsters:
             if prov_mons.can_be_spawned():
-                self.add_to_team(prov_mons())
-                element = Element.from_string(prov_mons.get_element())
-                self.team_task5.add(element.value)
+                self._spawn(prov_mons)
+                self.team_task5.add(prov_mons.get_element_type().value)
             else:
                 raise ValueError
         #Complexity O(comp) for best and worst case    
@@ -407,6 +427,48 @@ class MonsterTeam:
             return Battle.Action.ATTACK
         return Battle.Action.SWAP
 
+
+class TeamSpec:
+    """
+    Compact, picklable description of a MonsterTeam.
+
+    Holds what is needed to build the team again (modes, sort key and the
+    provided monster classes) rather than live monster instances, so it can
+    be shipped to worker processes cheaply.
+
+    Usage:
+        spec = TeamSpec(MonsterTeam.TeamMode.BACK, MonsterTeam.SelectionMode.RANDOM)
+        team = spec.build()
+    """
+
+    def __init__(
+        self,
+        team_mode: MonsterTeam.TeamMode,
+        selection_mode: MonsterTeam.SelectionMode,
+        provided_monsters: Optional[ArrayR[type[MonsterBase]]] = None,
+        sort_key: Optional[MonsterTeam.SortMode] = None,
+        team_limit: Optional[int] = None,
+    ) -> None:
+        """Store the team description
+        Complexity O(1) for best and worst case"""
+        self.team_mode = team_mode
+        self.selection_mode = selection_mode
+        self.provided_monsters = provided_monsters
+        self.sort_key = sort_key
+        self.team_limit = team_limit
+
+    def build(self) -> MonsterTeam:
+        """Return a new MonsterTeam following this spec
+        RANDOM specs draw from RandomGen exactly as MonsterTeam does.
+        Complexity O(comp) for best and worst case"""
+        return MonsterTeam(
+            self.team_mode,
+            self.selection_mode,
+            sort_key=self.sort_key,
+            provided_monsters=self.provided_monsters,
+            team_limit=self.team_limit,
+        )
+
 if __name__ == "__main__":
     team = MonsterTeam(
         team_mode=MonsterTeam.TeamMode.OPTIMISE,
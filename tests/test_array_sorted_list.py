@@ -0,0 +1,74 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from ed_utils.timeout import timeout
+
+from data_structures.array_sorted_list import ArraySortedList, ListItem
+from data_structures.referential_array import ArrayR
+
+class TestArraySortedList(TestCase):
+
+    @number("6.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_array_move(self):
+        a = ArrayR.from_list([0, 1, 2, 3, 4, 5])
+        a.move(0, 1, 4)
+        self.assertListEqual(a.to_list(), [0, 0, 1, 2, 3, 5])
+        a.move(2, 0, 4)
+        self.assertListEqual(a.to_list(), [1, 2, 3, 5, 3, 5])
+        b = ArrayR(3)
+        a.copy_into(b, 2, 1, 1)
+        self.assertListEqual(b.to_list(), [None, 2, 3])
+
+    @number("6.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_add_all(self):
+        sorted_list = ArraySortedList(1)
+        sorted_list.add(ListItem("b", 2))
+        sorted_list.add(ListItem("d", 4))
+        sorted_list.add_all(ArrayR.from_list([
+            ListItem("e", 5), ListItem("a", 1), ListItem("c1", 3), ListItem("b2", 2), ListItem("c2", 3),
+        ]))
+        self.assertListEqual(
+            [sorted_list[i].value for i in range(len(sorted_list))],
+            ["a", "b", "b2", "c1", "c2", "d", "e"],
+        )
+        self.assertEqual(sorted_list.delete_at_index(1).value, "b")
+        sorted_list.add(ListItem("z", 0))
+        self.assertListEqual(
+            [sorted_list[i].value for i in range(len(sorted_list))],
+            ["z", "a", "b2", "c1", "c2", "d", "e"],
+        )
+
+    @number("6.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_reverse_matches_readd(self):
+        key_sets = [
+            [-5, -3, -3, -3, -3, -1, -1, -1],
+            [-2, -2, -2, -2, -2, -2],
+            [-4, -1, 0, 2, 2],
+            [1, 2, 3],
+            [3, 3, 3, 3, 3, 3, 3],
+            [0, 0, 0, 1, 2],
+            [-3, -3, 1, 1, 1, 2],
+            [-1] * 40 + [1] * 25 + [2] * 9,
+        ]
+        for keys in key_sets:
+            fast = ArraySortedList(len(keys))
+            slow = ArraySortedList(len(keys))
+            for i in range(len(keys)):
+                fast.add(ListItem(i, keys[i]))
+                slow.add(ListItem(i, keys[i]))
+            for _ in range(2):
+                fast.reverse()
+                for _ in range(len(slow)):
+                    item = slow.delete_at_index(0)
+                    item.key = -item.key
+                    slow.add(item)
+                self.assertListEqual(
+                    [(fast[i].value, fast[i].key) for i in range(len(fast))],
+                    [(slow[i].value, slow[i].key) for i in range(len(slow))],
+                )
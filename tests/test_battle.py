@@ -4,6 +4,7 @@ from ed_utils.decorators import number, visibility
 from ed_utils.timeout import timeout
 
 from battle import Battle
+from elements import EffectivenessCalculator
 from team import MonsterTeam
 from helpers import Flamikin, Aquariuma, Vineon, Strikeon, Normake, Marititan, Leviatitan, Treetower, Infernoth
 
@@ -133,3 +134,57 @@ class TestBattle(TestCase):
         ]
         res = b.battle(team1, team2)
         self.assertEqual(res, Battle.Result.DRAW)
+
+    @number("4.9")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_exchange_cache(self):
+        def make_team(mode, simple_mode=True):
+            team = MonsterTeam(
+                team_mode=mode,
+                selection_mode=MonsterTeam.SelectionMode.PROVIDED,
+                provided_monsters=ArrayR.from_list([Flamikin, Aquariuma, Vineon, Strikeon]),
+            )
+            for i in range(team.snapshot_size):
+                team.snapshot[i].simple_mode = simple_mode
+            team.regenerate_team()
+            return team
+
+        uncached = Battle(exchange_cache_size=0)
+        cached = Battle()
+        team1 = make_team(MonsterTeam.TeamMode.BACK)
+        team2 = make_team(MonsterTeam.TeamMode.FRONT)
+        expected = uncached.battle(team1, team2)
+        for _ in range(3):
+            team1.regenerate_team()
+            team2.regenerate_team()
+            self.assertEqual(cached.battle(team1, team2), expected)
+            self.assertEqual(cached.turn_number, uncached.turn_number)
+        # Every exchange of the second and third battle was already seen.
+        self.assertGreater(cached.exchange_misses, 0)
+        self.assertEqual(cached.exchange_hits, 2 * cached.exchange_misses)
+        self.assertEqual(uncached.exchange_hits + uncached.exchange_misses, 0)
+
+        # Loading another effectiveness table drops the cached exchanges.
+        saved_instance = EffectivenessCalculator.instance
+        try:
+            EffectivenessCalculator.make_singleton()
+            team1.regenerate_team()
+            team2.regenerate_team()
+            misses = cached.exchange_misses
+            self.assertEqual(cached.battle(team1, team2), expected)
+            self.assertEqual(cached.exchange_misses, 2 * misses)
+        finally:
+            EffectivenessCalculator.instance = saved_instance
+
+        # Complex mode and custom action choices bypass the cache.
+        bypassed = Battle()
+        bypassed.battle(make_team(MonsterTeam.TeamMode.BACK, False), make_team(MonsterTeam.TeamMode.FRONT, False))
+        team1 = make_team(MonsterTeam.TeamMode.BACK)
+        team1.choose_action = lambda out, team: Battle.Action.ATTACK
+        bypassed.battle(team1, make_team(MonsterTeam.TeamMode.FRONT))
+        self.assertEqual(bypassed.exchange_hits + bypassed.exchange_misses, 0)
+
+        small = Battle(exchange_cache_size=2)
+        small.battle(make_team(MonsterTeam.TeamMode.BACK), make_team(MonsterTeam.TeamMode.FRONT))
+        self.assertLessEqual(len(small.exchange_cache), 2)
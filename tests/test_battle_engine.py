@@ -0,0 +1,57 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from ed_utils.timeout import timeout
+from random_gen import RandomGen
+
+from battle import Battle
+from battle_engine import LockstepBattleEngine
+from team import MonsterTeam
+
+from data_structures.referential_array import ArrayR
+
+class TestBattleEngine(TestCase):
+
+    def make_teams(self, n):
+        modes = [MonsterTeam.TeamMode.FRONT, MonsterTeam.TeamMode.BACK, MonsterTeam.TeamMode.OPTIMISE]
+        keys = [MonsterTeam.SortMode.HP, MonsterTeam.SortMode.ATTACK, MonsterTeam.SortMode.DEFENSE,
+                MonsterTeam.SortMode.SPEED, MonsterTeam.SortMode.LEVEL]
+        teams1 = ArrayR(n)
+        teams2 = ArrayR(n)
+        for i in range(n):
+            for teams in (teams1, teams2):
+                teams[i] = MonsterTeam(
+                    modes[RandomGen.randint(0, 2)],
+                    MonsterTeam.SelectionMode.RANDOM,
+                    sort_key=keys[RandomGen.randint(0, 4)],
+                )
+        return teams1, teams2
+
+    @number("4.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout(10)
+    def test_matches_object_engine(self):
+        for policy in [None, Battle.Action.SPECIAL]:
+            RandomGen.set_seed(123456789)
+            teams1, teams2 = self.make_teams(200)
+            engine = LockstepBattleEngine()
+            results = engine.run(teams1, teams2, policy, policy)
+
+            RandomGen.set_seed(123456789)
+            teams1, teams2 = self.make_teams(200)
+            for i in range(200):
+                if policy is not None:
+                    teams1[i].choose_action = lambda out, team: policy
+                    teams2[i].choose_action = lambda out, team: policy
+                b = Battle(verbosity=0)
+                self.assertEqual(b.battle(teams1[i], teams2[i]), results[i])
+                self.assertEqual(b.turn_number, engine.turns[i])
+
+    @number("4.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_custom_action_needs_policy(self):
+        RandomGen.set_seed(123456789)
+        teams1, teams2 = self.make_teams(1)
+        teams1[0].choose_action = lambda out, team: Battle.Action.ATTACK
+        self.assertRaises(ValueError, lambda: LockstepBattleEngine().run(teams1, teams2))
@@ -0,0 +1,42 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from ed_utils.timeout import timeout
+
+from battle import Battle
+from battle_simulator import BattleSimulator, Matchup
+from team import MonsterTeam, TeamSpec
+from helpers import Flamikin, Aquariuma, Vineon, Strikeon
+
+from data_structures.referential_array import ArrayR
+
+class TestBattleSimulator(TestCase):
+
+    @number("4.10")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_matches_single_battle(self):
+        provided = ArrayR.from_list([Flamikin, Aquariuma, Vineon, Strikeon])
+        spec1 = TeamSpec(MonsterTeam.TeamMode.BACK, MonsterTeam.SelectionMode.PROVIDED, provided)
+        spec2 = TeamSpec(MonsterTeam.TeamMode.FRONT, MonsterTeam.SelectionMode.PROVIDED, provided)
+        b = Battle(verbosity=0)
+        expected = b.battle(spec1.build(), spec2.build())
+
+        got = list(BattleSimulator(seed=1).run_many([Matchup(spec1, spec2)]))
+        self.assertEqual(got, [(expected, b.turn_number)])
+
+    @number("4.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout(10)
+    def test_worker_count_independent(self):
+        spec = TeamSpec(MonsterTeam.TeamMode.BACK, MonsterTeam.SelectionMode.RANDOM)
+        matchups = [Matchup(spec, spec) for _ in range(20)]
+        serial = list(BattleSimulator(seed=123456789).run_many(matchups))
+        parallel = list(BattleSimulator(seed=123456789).run_many(matchups, workers=2, chunk_size=3))
+        self.assertEqual(len(serial), 20)
+        self.assertEqual(serial, parallel)
+        # Matchup seeds never repeat, even past 65536 matchups.
+        chunks = BattleSimulator(seed=42)._seeded_chunks((Matchup(spec, spec) for _ in range(65537)), 65537)
+        seeds = [seed for seed, _, _ in next(chunks)]
+        self.assertNotEqual(seeds[65536], seeds[0])
+        self.assertEqual(len(set(seeds)), len(seeds))
@@ -0,0 +1,63 @@
+import os
+import tempfile
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from ed_utils.timeout import timeout
+
+from battle import Battle
+from battle_trace import BattleTrace
+from team import MonsterTeam
+from helpers import Aquariuma, get_all_monsters
+
+from data_structures.referential_array import ArrayR
+
+class TestBattleTrace(TestCase):
+
+    def make_teams(self):
+        teams = []
+        for mode in [MonsterTeam.TeamMode.BACK, MonsterTeam.TeamMode.FRONT]:
+            team = MonsterTeam(
+                team_mode=mode,
+                selection_mode=MonsterTeam.SelectionMode.PROVIDED,
+                provided_monsters=ArrayR.from_list([Aquariuma, Aquariuma]),
+            )
+            team.choose_action = lambda out, team: Battle.Action.ATTACK
+            teams.append(team)
+        return teams
+
+    @number("4.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_trace_records(self):
+        trace = BattleTrace()
+        b = Battle(trace=trace)
+        self.assertEqual(b.battle(*self.make_teams()), Battle.Result.DRAW)
+        self.assertEqual(b.battle(*self.make_teams()), Battle.Result.DRAW)
+        records = list(trace)
+        self.assertEqual(len(trace), 16)
+        self.assertEqual(len(records), 16)
+        aquariuma = list(get_all_monsters()).index(Aquariuma)
+        first = records[0]
+        self.assertEqual((first.battle, first.turn), (0, 1))
+        self.assertEqual((first.action1, first.action2), (Battle.Action.ATTACK.value,) * 2)
+        self.assertEqual((first.monster1, first.monster2), (aquariuma, aquariuma))
+        # 1 damage from the attack and 1 from the end of turn.
+        self.assertEqual((first.damage1, first.hp1, first.level1, first.evolved1), (2, 6, 1, 0))
+        self.assertListEqual([r.hp2 for r in records[:8]], [6, 4, 2, 0, 6, 4, 2, 0])
+        self.assertEqual((records[8].battle, records[8].turn), (1, 1))
+
+    @number("4.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_trace_stream(self):
+        expected = BattleTrace()
+        Battle(trace=expected).battle(*self.make_teams())
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "battle.trace")
+            # Tiny flush size so the buffer is written out mid-battle.
+            with BattleTrace.open(path, flush_bytes=BattleTrace.RECORD.size * 3) as trace:
+                Battle(trace=trace).battle(*self.make_teams())
+                self.assertLess(len(trace.buffer), BattleTrace.RECORD.size * 3)
+            self.assertEqual(os.path.getsize(path), BattleTrace.RECORD.size * 8)
+            self.assertListEqual(list(BattleTrace.read(path, chunk_records=3)), list(expected))
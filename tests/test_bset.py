@@ -0,0 +1,50 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from ed_utils.timeout import timeout
+
+from data_structures.bset import BSet
+
+class TestBSet(TestCase):
+
+    @number("6.4")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_len_and_iter(self):
+        s = BSet()
+        self.assertEqual(len(s), 0)
+        self.assertListEqual(list(s), [])
+        for item in [18, 1, 5, 64, 3]:
+            s.add(item)
+        self.assertEqual(len(s), 5)
+        self.assertListEqual(list(s), [1, 3, 5, 18, 64])
+        s.remove(5)
+        self.assertEqual(len(s), 4)
+        self.assertListEqual(list(s), [1, 3, 18, 64])
+
+    @number("6.5")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_in_place(self):
+        s = BSet()
+        t = BSet()
+        for item in [1, 2, 3]:
+            s.add(item)
+        for item in [3, 4]:
+            t.add(item)
+        original = s
+        s |= t
+        self.assertIs(s, original)
+        self.assertListEqual(list(s), [1, 2, 3, 4])
+        s -= t
+        self.assertListEqual(list(s), [1, 2])
+        s ^= t
+        self.assertListEqual(list(s), [1, 2, 3, 4])
+        s &= t
+        self.assertIs(s, original)
+        self.assertListEqual(list(s), [3, 4])
+        s.difference_update(t)
+        self.assertTrue(s.is_empty())
+        s.update(t)
+        self.assertListEqual(list(s), [3, 4])
+        self.assertListEqual(list(t), [3, 4])
@@ -1,3 +1,4 @@
+from array import array
 from unittest import TestCase
 
 from ed_utils.decorators import number, visibility
@@ -16,3 +17,17 @@ class TestElementEffectiveness(TestCase):
         self.assertEqual(EffectivenessCalculator.get_effectiveness(Element.NORMAL, Element.GHOST), 0)
         self.assertEqual(EffectivenessCalculator.get_effectiveness(Element.DRAGON, Element.DRAGON), 2)
         self.assertEqual(EffectivenessCalculator.get_effectiveness(Element.WATER, Element.GRASS), 0.5)
+
+    @number("2.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_effectiveness_many(self):
+        attackers = array("l", [Element.FIRE.value, Element.NORMAL.value, Element.WATER.value])
+        defenders = array("l", [Element.GRASS.value, Element.GHOST.value, Element.GRASS.value])
+        self.assertEqual(EffectivenessCalculator.get_effectiveness_many(attackers, defenders).tolist(), [2, 0, 0.5])
+        for attacker in Element:
+            for defender in Element:
+                self.assertEqual(
+                    EffectivenessCalculator.get_effectiveness_many(array("l", [attacker.value]), array("l", [defender.value]))[0],
+                    EffectivenessCalculator.get_effectiveness(attacker, defender),
+                )
@@ -0,0 +1,49 @@
+import os
+import subprocess
+import sys
+import tempfile
+from unittest import TestCase, mock
+
+from ed_utils.decorators import number, visibility
+from ed_utils.timeout import timeout
+
+from helpers import _load_roster
+
+class TestHelpers(TestCase):
+
+    @number("1.9")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_roster_cache(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "roster.yaml")
+            with open(path, "w") as f:
+                f.write("- name: A\n  element: Fire\n")
+            self.assertEqual(_load_roster(path), [{"name": "A", "element": "Fire"}])
+            self.assertTrue(os.path.exists(path + ".cache"))
+            # Served from the cache, without parsing the YAML again.
+            with mock.patch("helpers.yaml.load", side_effect=AssertionError("roster was re-parsed")):
+                self.assertEqual(_load_roster(path), [{"name": "A", "element": "Fire"}])
+            # A changed source invalidates it.
+            with open(path, "w") as f:
+                f.write("- name: B\n  element: Water\n")
+            self.assertEqual(_load_roster(path), [{"name": "B", "element": "Water"}])
+
+    @number("1.10")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout(10)
+    def test_lazy_import(self):
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        script = (
+            "import sys; sys.path.insert(0, sys.argv[1])\n"
+            "import tower, helpers, elements\n"
+            "assert helpers._monsters is None and elements.EffectivenessCalculator.instance is None\n"
+            "from helpers import Flamikin\n"
+            "assert helpers._monsters is not None\n"
+            "helpers.preload()\n"
+            "assert elements.EffectivenessCalculator.instance is not None\n"
+        )
+        with tempfile.TemporaryDirectory() as directory:
+            # Run from elsewhere to check nothing depends on the working directory.
+            done = subprocess.run([sys.executable, "-c", script, root], cwd=directory, capture_output=True, text=True)
+        self.assertEqual(done.returncode, 0, done.stderr)
@@ -3,6 +3,7 @@ from unittest import TestCase
 from ed_utils.decorators import number, visibility
 from ed_utils.timeout import timeout
 
+from elements import Element
 from monster_base import MonsterBase
 # These classes inherit from MonsterBase,
 # but you don't need to implement them explicitly.
@@ -72,3 +73,29 @@ class TestMonsters(TestCase):
         self.assertEqual(t.get_max_hp(), 14)
         self.assertEqual(t.get_hp(), 12)
 
+
+    @number("1.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_element_type(self):
+        class MockedMetalhorn(Metalhorn):
+            pass
+        self.assertEqual(Infernox.get_element_type(), Element.FIRE)
+        self.assertEqual(Metalhorn(simple_mode=True, level=1).get_element_type(), Element.STEEL)
+        self.assertEqual(MockedMetalhorn.get_element_type(), Element.STEEL)
+
+    @number("1.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_slotted_instances(self):
+        monster = Metalhorn(simple_mode=True, level=1)
+        self.assertFalse(hasattr(monster, "__dict__"))
+        self.assertRaises(AttributeError, lambda: setattr(monster, "stats", None))
+
+        class StrongMetalhorn(Metalhorn):
+            def get_attack(self):
+                return 100
+        strong = StrongMetalhorn(simple_mode=True, level=1)
+        strong.extra = 1
+        self.assertEqual(strong.get_attack(), 100)
+        self.assertEqual(strong.get_defense(), monster.get_defense())
@@ -0,0 +1,62 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from ed_utils.timeout import timeout
+
+from random_gen import RandomGen
+
+class TestRandomGen(TestCase):
+
+    @number("6.1")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_skip(self):
+        RandomGen.set_seed(123456789)
+        for _ in range(1000):
+            RandomGen.random()
+        expected = RandomGen.random()
+        RandomGen.set_seed(123456789)
+        RandomGen.skip(1000)
+        self.assertEqual(RandomGen.random(), expected)
+
+    @number("6.2")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_streams(self):
+        RandomGen.set_seed(123456789)
+        first = RandomGen.stream(0)
+        second = RandomGen.stream(1)
+        expected = [RandomGen.randint(1, 10) for _ in range(20)]
+        self.assertListEqual([first.randint(1, 10) for _ in range(20)], expected)
+
+        RandomGen.set_seed(123456789)
+        RandomGen.skip(RandomGen.STREAM_SPACING)
+        expected = [RandomGen.random() for _ in range(20)]
+        self.assertListEqual([second.random() for _ in range(20)], expected)
+
+    @number("6.3")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_bulk_draws(self):
+        RandomGen.set_seed(123456789)
+        expected = [RandomGen.random() for _ in range(50)] + [RandomGen.randint(-3, 7) for _ in range(50)]
+        RandomGen.set_seed(123456789)
+        got = RandomGen.random_block(50).tolist() + RandomGen.randints(-3, 7, 50).tolist()
+        self.assertListEqual(got, expected)
+        self.assertEqual(len(RandomGen.random_block(0)), 0)
+
+        stream = RandomGen.stream(2)
+        expected = [stream.randint(1, 6) for _ in range(10)]
+        self.assertListEqual(RandomGen.stream(2).randints(1, 6, 10).tolist(), expected)
+
+    @number("6.12")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_many_streams(self):
+        # Far more substreams than a 2^32 spacing would allow, all distinct.
+        starts = {RandomGen.stream(i, 42).seed for i in [0, 1, 65535, 65536, 65537, 1 << 20]}
+        self.assertEqual(len(starts), 6)
+        self.assertEqual(RandomGen.stream(65536, 42).seed, RandomGen.jump(42, 65536 * RandomGen.STREAM_SPACING))
+        RandomGen.stream(RandomGen.STREAM_COUNT - 1, 42)
+        self.assertRaises(ValueError, lambda: RandomGen.stream(RandomGen.STREAM_COUNT, 42))
+        self.assertRaises(ValueError, lambda: RandomGen.stream(-1, 42))
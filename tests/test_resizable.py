@@ -0,0 +1,47 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from ed_utils.timeout import timeout
+
+from data_structures.queue_adt import CircularQueue, ResizableCircularQueue
+from data_structures.stack_adt import ResizableArrayStack
+
+class TestResizable(TestCase):
+
+    @number("6.9")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_resizable_queue(self):
+        queue = ResizableCircularQueue(2)
+        queue.append(0)
+        queue.append(1)
+        queue.serve()
+        for i in range(2, 20):
+            # Grows while wrapped around.
+            queue.append(i)
+        self.assertFalse(queue.is_full())
+        self.assertListEqual([queue.serve() for _ in range(len(queue))], list(range(1, 20)))
+
+    @number("6.10")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_rotate_and_reverse(self):
+        for capacity in [5, 8]:
+            queue = CircularQueue(capacity)
+            queue.append(-1)
+            queue.serve()
+            for i in range(5):
+                queue.append(i)
+            queue.reverse_range(1, 4)
+            queue.rotate(2)
+            self.assertListEqual([queue.serve() for _ in range(5)], [2, 1, 4, 0, 3])
+
+    @number("6.11")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_resizable_stack(self):
+        stack = ResizableArrayStack(1)
+        for i in range(10):
+            stack.push(i)
+        stack.reverse_top(3)
+        self.assertListEqual([stack.pop() for _ in range(10)], [7, 8, 9, 6, 5, 4, 3, 2, 1, 0])
@@ -0,0 +1,59 @@
+import csv
+import json
+import os
+import tempfile
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from ed_utils.timeout import timeout
+
+from battle import Battle
+from random_gen import RandomGen
+from result_sinks import ArraySink, CsvSink, JsonlSink, ResultSink
+from team import MonsterTeam
+from tower import BattleTower
+
+class TestResultSinks(TestCase):
+
+    def make_tower(self):
+        RandomGen.set_seed(123456789)
+        bt = BattleTower(Battle(verbosity=0))
+        bt.set_my_team(MonsterTeam(MonsterTeam.TeamMode.BACK, MonsterTeam.SelectionMode.RANDOM))
+        bt.generate_teams(5, lazy=True)
+        return bt
+
+    @number("5.10")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_stream_results(self):
+        bt = self.make_tower()
+        expected = []
+        while bt.battles_remaining():
+            enemy_id = bt.current_enemy_id
+            result, _, _, lives, enemy_lives = bt.next_battle()
+            expected.append((len(expected), result.value, lives, enemy_lives, enemy_id, bt.battle.turn_number))
+        self.assertEqual(len(bt.history), 0)
+        # Every enemy team was fought first in generation order.
+        self.assertListEqual([row[4] for row in expected[:5]], [0, 1, 2, 3, 4])
+
+        sink = ArraySink()
+        bt = self.make_tower()
+        self.assertEqual(bt.stream_results(sink, limit=3), 3)
+        self.assertEqual(bt.stream_results(sink), len(expected) - 3)
+        self.assertListEqual(list(sink), expected)
+        self.assertEqual(sink[2], expected[2])
+
+        with tempfile.TemporaryDirectory() as directory:
+            csv_path = os.path.join(directory, "results.csv")
+            jsonl_path = os.path.join(directory, "results.jsonl")
+            with CsvSink(csv_path, batch_size=2) as sink:
+                self.make_tower().stream_results(sink)
+            with JsonlSink(jsonl_path, batch_size=2) as sink:
+                self.make_tower().stream_results(sink)
+            with open(csv_path, newline="") as f:
+                rows = list(csv.reader(f))
+            self.assertListEqual(rows[0], list(ResultSink.FIELDS))
+            self.assertListEqual([tuple(map(int, row)) for row in rows[1:]], expected)
+            with open(jsonl_path) as f:
+                rows = [json.loads(line) for line in f]
+            self.assertListEqual([tuple(row[field] for field in ResultSink.FIELDS) for row in rows], expected)
@@ -58,3 +58,23 @@ class TestStats(TestCase):
         self.assertEqual(cs.get_defense(1), 8)
         self.assertEqual(cs.get_speed(5), 250)
         self.assertEqual(cs.get_max_hp(41), 6)
+
+    @number("1.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_compiled_formula(self):
+        speed = ArrayR.from_list(["level", "3", "power", "1", "2", "3", "middle", "*"])
+        max_hp = ArrayR.from_list(["level", "5", "-", "sqrt", "1", "10", "middle"])
+        cs = ComplexStats(
+            ArrayR.from_list(["5", "6", "+"]),
+            ArrayR.from_list(["level", "2", "/", "level", "-"]),
+            speed,
+            max_hp,
+        )
+        for level in range(5, 50):
+            self.assertEqual(cs.get_speed(level), cs.calculate_formula(speed, level))
+            self.assertEqual(cs.get_max_hp(level), cs.calculate_formula(max_hp, level))
+        self.assertEqual(cs.get_defense(4), -2)
+        self.assertEqual(cs.get_attack(3), 11)
+        cs.get_speed(49)
+        self.assertEqual(cs.speed_at.cache_info().hits, 1)
@@ -8,6 +8,7 @@ from ed_utils.timeout import timeout
 from random_gen import RandomGen
 
 from team import MonsterTeam
+from helpers import get_all_monsters, get_spawnable_monsters
 from helpers import Flamikin, Aquariuma, Vineon, Normake, Thundrake, Rockodile, Mystifly, Strikeon, Faeboa, Soundcobra
 
 from data_structures.referential_array import ArrayR
@@ -257,3 +258,69 @@ class TestTeam(TestCase):
 
         self.assertEqual(len(team), 1)
         self.assertIsInstance(team.retrieve_from_team(), Flamikin)
+
+    @number("3.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_spawnable_index(self):
+        monsters = get_all_monsters()
+        expected = [monsters[x] for x in range(len(monsters)) if monsters[x].can_be_spawned()]
+        self.assertListEqual(get_spawnable_monsters().to_list(), expected)
+
+    @number("3.9")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_regenerate_in_place(self):
+        team = MonsterTeam(
+            team_mode=MonsterTeam.TeamMode.BACK,
+            selection_mode=MonsterTeam.SelectionMode.PROVIDED,
+            provided_monsters=ArrayR.from_list([Flamikin, Aquariuma]),
+        )
+        container = team.team
+        flamikin = team.retrieve_from_team()
+        flamikin.level_up()
+        flamikin.set_hp(1)
+        team.retrieve_from_team()
+        team.regenerate_team()
+        self.assertIs(team.team, container)
+        self.assertEqual(len(team), 2)
+        regenerated = team.retrieve_from_team()
+        self.assertIs(regenerated, flamikin)
+        self.assertEqual(str(regenerated), "LV.1 Flamikin, 6/6 HP")
+
+    @number("3.10")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_large_team(self):
+        n = 1000
+        provided = ArrayR(n)
+        for i in range(n):
+            provided[i] = [Flamikin, Aquariuma, Vineon][i % 3]
+        for mode in [MonsterTeam.TeamMode.FRONT, MonsterTeam.TeamMode.BACK]:
+            team = MonsterTeam(
+                team_mode=mode,
+                selection_mode=MonsterTeam.SelectionMode.PROVIDED,
+                provided_monsters=provided,
+                team_limit=n,
+            )
+            self.assertEqual(len(team), n)
+            # Full, so extra monsters are still dropped.
+            team.add_to_team(Thundrake())
+            self.assertEqual(len(team), n)
+            team.special()
+            first = team.retrieve_from_team()
+            if mode == MonsterTeam.TeamMode.FRONT:
+                # Top 3 were monsters 999, 998, 997, now reversed.
+                self.assertIsInstance(first, Aquariuma)
+            else:
+                # Back half reversed to the front: last monster first.
+                self.assertIsInstance(first, [Flamikin, Aquariuma, Vineon][(n - 1) % 3])
+            team.regenerate_team()
+            self.assertEqual(len(team), n)
+
+        self.assertRaises(ValueError, lambda: MonsterTeam(
+            team_mode=MonsterTeam.TeamMode.BACK,
+            selection_mode=MonsterTeam.SelectionMode.PROVIDED,
+            provided_monsters=provided,
+            team_limit=n - 1,
+        ))
@@ -1,3 +1,6 @@
+import os
+import shutil
+import tempfile
 from unittest import TestCase
 
 from ed_utils.decorators import number, visibility, advanced
@@ -8,10 +11,22 @@ from battle import Battle
 from elements import Element
 from team import MonsterTeam
 from tower import BattleTower, tournament_balanced
+from battle_engine import LockstepBattleEngine
 from helpers import Flamikin, Faeboa
 
 from data_structures.referential_array import ArrayR
 
+class SlowStartBattle(Battle):
+    """Battle where team 2 always strikes first, to give bisect a divergence."""
+
+    def battle_attack(self, act1, act2):
+        if act1 == Battle.Action.ATTACK and act2 == Battle.Action.ATTACK:
+            self.out2.attack(self.out1)
+            if self.out1.alive():
+                self.out1.attack(self.out2)
+        else:
+            super().battle_attack(act1, act2)
+
 class GoodFlamikin(Flamikin):
 
     def get_attack(self):
@@ -255,3 +270,88 @@ class TestTower(TestCase):
         self.assertFalse(tournament_balanced(invalid2))
         self.assertFalse(tournament_balanced(unbalanced))
         self.assertTrue(tournament_balanced(balanced))
+
+    @number("5.6")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_replay(self):
+        RandomGen.set_seed(123456789)
+        bt = BattleTower(Battle(verbosity=0), record_history=True)
+        bt.set_my_team(MonsterTeam(MonsterTeam.TeamMode.FRONT, MonsterTeam.SelectionMode.RANDOM))
+        bt.generate_teams(4)
+        results = []
+        while bt.battles_remaining():
+            results.append(bt.next_battle()[0])
+        seed = RandomGen.seed
+        self.assertEqual(len(bt.history), len(results))
+        # Replay out of order, and without disturbing the generator.
+        for i in reversed(range(len(results))):
+            self.assertEqual(bt.replay(i), results[i])
+            self.assertEqual(bt.replay(i, LockstepBattleEngine()), results[i])
+        self.assertEqual(RandomGen.seed, seed)
+
+        for i in range(len(results)):
+            self.assertIsNone(bt.bisect(i, Battle(), LockstepBattleEngine()))
+        diverged = [bt.bisect(i, Battle(), SlowStartBattle()) for i in range(len(results))]
+        diverged = [records for records in diverged if records is not None]
+        self.assertGreater(len(diverged), 0)
+        for expected, got in diverged:
+            self.assertEqual(expected.turn, got.turn)
+            self.assertNotEqual(expected, got)
+
+    @number("5.8")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_checkpoint_resume(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, "tower.ckpt")
+            saved = os.path.join(directory, "tower5.ckpt")
+            RandomGen.set_seed(123456789)
+            bt = BattleTower(Battle(verbosity=0), record_history=True)
+            bt.set_my_team(MonsterTeam(
+                MonsterTeam.TeamMode.OPTIMISE,
+                MonsterTeam.SelectionMode.RANDOM,
+                sort_key=MonsterTeam.SortMode.HP,
+            ))
+            bt.generate_teams(8)
+            bt.enable_checkpoints(path, 5)
+            got = []
+            for result, team1, team2, lives1, lives2 in bt:
+                got.append((result, lives1, lives2))
+                if len(got) == 5:
+                    shutil.copy(path, saved)
+            self.assertGreater(len(got), 5)
+            meta = [e.value for e in bt.out_of_meta()]
+
+            # Resuming replays the rest of the run, RandomGen included.
+            RandomGen.set_seed(1)
+            resumed = BattleTower.resume(saved)
+            self.assertEqual(resumed.battles_fought, 5)
+            rest = [(result, lives1, lives2) for result, team1, team2, lives1, lives2 in resumed]
+            self.assertListEqual(rest, got[5:])
+            self.assertListEqual([e.value for e in resumed.out_of_meta()], meta)
+            self.assertEqual(RandomGen.seed, bt.history[-1].seed)
+
+    @number("5.9")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_lazy_generation(self):
+        runs = []
+        for lazy in [False, True]:
+            RandomGen.set_seed(123456789)
+            bt = BattleTower(Battle(verbosity=0))
+            bt.set_my_team(MonsterTeam(MonsterTeam.TeamMode.BACK, MonsterTeam.SelectionMode.RANDOM))
+            bt.generate_teams(6, lazy=lazy)
+            seed = RandomGen.seed
+            if lazy:
+                # Only the served team has been built.
+                self.assertIsInstance(bt.current_enemy, MonsterTeam)
+                for _ in range(len(bt.enemy)):
+                    entry = bt.enemy.serve()
+                    self.assertNotIsInstance(entry, MonsterTeam)
+                    bt.enemy.append(entry)
+            got = []
+            for result, team1, team2, lives1, lives2 in bt:
+                got.append((result, lives1, lives2, str(team2.to_spec().provided_monsters)))
+            runs.append((seed, got, [e.value for e in bt.out_of_meta()]))
+        self.assertEqual(runs[0], runs[1])
@@ -0,0 +1,48 @@
+from unittest import TestCase
+
+from ed_utils.decorators import number, visibility
+from ed_utils.timeout import timeout
+
+from battle import Battle
+from random_gen import RandomGen
+from team import MonsterTeam, TeamSpec
+from tower import BattleTower
+from tower_fleet import TowerFleet, TowerRun
+
+class TestTowerFleet(TestCase):
+
+    def summary(self, report):
+        return [
+            (t.seed, t.battles, t.lives, t.enemy_lives, [e.value for e in t.out_of_meta])
+            for t in report.towers
+        ]
+
+    @number("5.7")
+    @visibility(visibility.VISIBILITY_SHOW)
+    @timeout()
+    def test_fleet_matches_serial(self):
+        RandomGen.set_seed(42)
+        spec = TeamSpec(MonsterTeam.TeamMode.FRONT, MonsterTeam.SelectionMode.RANDOM)
+        runs = [TowerRun(spec, 4, seed) for seed in range(123, 135)]
+        serial = TowerFleet().run(runs)
+        parallel = TowerFleet(workers=2, chunk_size=3).run(runs)
+        self.assertListEqual(self.summary(parallel), self.summary(serial))
+        self.assertEqual(RandomGen.seed, 42)
+
+        # The same as running a tower by hand.
+        RandomGen.set_seed(126)
+        bt = BattleTower(Battle(verbosity=0))
+        bt.set_my_team(MonsterTeam(MonsterTeam.TeamMode.FRONT, MonsterTeam.SelectionMode.RANDOM))
+        bt.generate_teams(4)
+        battles = 0
+        while bt.battles_remaining():
+            bt.next_battle()
+            battles += 1
+        tower = serial.towers[3]
+        self.assertEqual((tower.battles, tower.lives), (battles, bt.mine_lives))
+        self.assertListEqual([e.value for e in tower.out_of_meta], [e.value for e in bt.out_of_meta()])
+
+        self.assertEqual(len(serial), 12)
+        self.assertEqual(serial.battles, sum(t.battles for t in serial.towers))
+        self.assertEqual(serial.cleared, sum(t.lives > 0 for t in serial.towers))
+        self.assertEqual(sum(serial.meta_counts), sum(len(t.out_of_meta) for t in serial.towers))
@@ -1,16 +1,23 @@
 from __future__ import annotations
+import os
+import pickle
+from array import array
 
 from random_gen import RandomGen
-from team import MonsterTeam
+from team import MonsterTeam, TeamSpec
 from battle import Battle
+from battle_simulator import Matchup
+from battle_trace import BattleTrace, TraceRecord, first_divergence
+from result_sinks import ResultSink
 from elements import Element
-from typing import Generic, TypeVar
+from typing import Generic, Optional, TypeVar
 
 from data_structures.queue_adt import CircularQueue
 from data_structures.referential_array import ArrayR
 from data_structures.bset import BSet
 from data_structures.array_sorted_list import ArraySortedList
 from data_structures.array_sorted_list import ListItem
+from data_structures.stack_adt import ArrayStack
 
 class Iterator(Generic[TypeVar("T")]):
     def __init__(self, battle_tower: BattleTower) -> None:
@@ -43,16 +50,24 @@ class BattleTower:
 
     MIN_LIVES = 2
     MAX_LIVES = 10
+    CHECKPOINT_VERSION = 2
 
-    def __init__(self, battle: Battle|None=None) -> None:
+    def __init__(self, battle: Battle|None=None, record_history: bool=False) -> None:
         """Initialize a BattleTower instance
         :param: battle: Battle: a Battle instance to execute the
+        :param: record_history: keep history for replay and bisect; it grows by one entry per battle
         mine: Our team
         mine_lives: our team lives
         enemy: Enemy team
         enemy_lives: Enemy team lives
+        enemy_ids: Enemy team ids, numbered in generation order
         current_enemy: Current enemy team
         current_enemy_live: Current enemy team live
+        current_enemy_id: Current enemy team id
+        current_enemy_entry: the enemy queue entry current_enemy came from
+        history: seed and team specs at the start of every battle, for replay (only with record_history)
+        battles_fought: number of battles played, including before a resume
+        checkpoint_path, checkpoint_every: see enable_checkpoints
         Complexity O(1) for best and worst case
         """
         self.battle = battle or Battle(verbosity=0)
@@ -60,8 +75,16 @@ class BattleTower:
         self.mine_lives = None
         self.enemy = None
         self.enemy_lives = None
+        self.enemy_ids = None
         self.current_enemy = None
         self.current_enemy_lives = None
+        self.current_enemy_id = None
+        self.current_enemy_entry = None
+        self.record_history = record_history
+        self.history = []
+        self.battles_fought = 0
+        self.checkpoint_path = None
+        self.checkpoint_every = 0
 
         self.internal_meta = BSet(len(Element.__members__))
         self.external_meta = BSet(len(Element.__members__))
@@ -73,15 +96,23 @@ class BattleTower:
         # Generate the team lives here too.
         self.mine = team
         self.mine_lives = RandomGen.randint(BattleTower.MIN_LIVES, BattleTower.MAX_LIVES)
-        self.internal_meta = self.internal_meta.union(self.mine.get_the_element())
+        self.internal_meta |= self.mine.get_the_element()
 
-    def generate_teams(self, n: int) -> None:
+    def generate_teams(self, n: int, lazy: bool = False) -> None:
         """Generate both team
+        With lazy, the enemy queue holds each team's spawnable monster indices
+        (MonsterTeam.random_picks) instead of a MonsterTeam, and the team is only
+        built when next_team serves it. RandomGen is drawn from in the same order.
         Complexity O(n) for best and worst case where n is the team size/input of the function"""
         self.enemy_lives = CircularQueue(n)
         self.enemy = CircularQueue(n)
-        for _ in range(n):
-            self.enemy.append(MonsterTeam(MonsterTeam.TeamMode.BACK, MonsterTeam.SelectionMode.RANDOM))
+        self.enemy_ids = CircularQueue(n)
+        for i in range(n):
+            self.enemy_ids.append(i)
+            if lazy:
+                self.enemy.append(array("H", MonsterTeam.random_picks()))
+            else:
+                self.enemy.append(MonsterTeam(MonsterTeam.TeamMode.BACK, MonsterTeam.SelectionMode.RANDOM))
             self.enemy_lives.append(RandomGen.randint(BattleTower.MIN_LIVES, BattleTower.MAX_LIVES))
 
         self.next_team()
@@ -100,6 +131,9 @@ class BattleTower:
     def next_battle(self) -> tuple[Battle.Result, MonsterTeam, MonsterTeam, int, int]:
         """Return Tuple of the Battle Result, Monster Team, my team lives and current enemy lives
         Complexity O(1) for best and worst case"""
+        # Specs are cached on the teams, so this is O(1) after a team's first battle.
+        if self.record_history:
+            self.history.append(Matchup(self.mine.to_spec(), self.current_enemy.to_spec(), RandomGen.seed))
         self.mine.regenerate_team()
         self.current_enemy.regenerate_team()
         
@@ -117,52 +151,103 @@ class BattleTower:
             self.mine_lives -= 1
         
         if self.current_enemy_lives > 0:
-            self.enemy.append(self.current_enemy)
+            # Lazy teams go back in compact form and are rebuilt when served again.
+            self.enemy.append(self.current_enemy_entry)
             self.enemy_lives.append(self.current_enemy_lives)
+            self.enemy_ids.append(self.current_enemy_id)
 
         tower_ans = (result, self.mine, self.current_enemy, self.mine_lives, self.current_enemy_lives)
         self.updates()
+        self.battles_fought += 1
+        if self.checkpoint_path is not None and self.battles_fought % self.checkpoint_every == 0:
+            self.save_checkpoint(self.checkpoint_path)
         return tower_ans
     
+    def replay(self, index: int, battle: Optional[Battle] = None) -> Battle.Result:
+        """Re-run battle number index (0 based) from its snapshot, without touching the tower
+        Needs a tower created with record_history.
+        battle can be any engine with a battle(team1, team2) method; a fresh Battle by default.
+        Teams are rebuilt from their specs, so choose_action overrides on instances are not replayed.
+        Complexity O(comp) for best and worst case"""
+        matchup = self.history[index]
+        saved_seed = RandomGen.seed
+        RandomGen.set_seed(matchup.seed)
+        try:
+            return (battle or Battle(verbosity=0)).battle(matchup.team1.build(), matchup.team2.build())
+        finally:
+            RandomGen.seed = saved_seed
+
+    def bisect(self, index: int, engine1, engine2) -> Optional[tuple[Optional[TraceRecord], Optional[TraceRecord]]]:
+        """Replay battle index on two engines and return their records for the first turn that differs
+        A side that had already finished gives None. Returns None if the engines agree on every turn.
+        Both engines must accept a trace attribute, like Battle and LockstepBattleEngine.
+        Complexity O(comp) for best and worst case"""
+        traces = []
+        for engine in (engine1, engine2):
+            trace = BattleTrace()
+            saved_trace = engine.trace
+            engine.trace = trace
+            try:
+                self.replay(index, engine)
+            finally:
+                engine.trace = saved_trace
+            traces.append(trace)
+
+        turn = first_divergence(traces[0], traces[1])
+        if turn == -1:
+            return None
+        return tuple(trace[turn] if turn < len(trace) else None for trace in traces)
+
     def updates(self):
         """ Update the internal and external meta
         Complexity O(1) for best and worst case"""
         # Update the internal meta
         team_element = self.mine.get_the_element()
         enemy_element = self.current_enemy.get_the_element()
-        self.internal_meta = self.internal_meta.union(enemy_element).union(team_element)
-        self.internal_meta = self.internal_meta.difference(self.external_meta)
+        # In place, so the bookkeeping allocates no new sets
+        self.internal_meta |= enemy_element
+        self.internal_meta |= team_element
+        self.internal_meta -= self.external_meta
         self.next_team()
         if self.current_enemy is not None:
             #update the external meta
-            self.external_meta = self.external_meta.union(self.internal_meta)
-            self.external_meta = self.external_meta.difference(self.current_enemy.get_the_element())
-            self.external_meta = self.external_meta.difference(self.mine.get_the_element())
+            self.external_meta |= self.internal_meta
+            self.external_meta -= self.current_enemy.get_the_element()
+            self.external_meta -= self.mine.get_the_element()
     
 
     def next_team(self):
         """Serve the monster out of the enemy team
         Complexity O(1) for best and worst case"""
         try:
-            self.current_enemy = self.enemy.serve()
+            self.current_enemy_entry = self.enemy.serve()
             self.current_enemy_lives = self.enemy_lives.serve()
+            self.current_enemy_id = self.enemy_ids.serve()
         except:
+            self.current_enemy_entry = None
             self.current_enemy = None
             self.current_enemy_lives = None
+            self.current_enemy_id = None
+            return
+        self.current_enemy = self._enemy_team(self.current_enemy_entry)
+
+    @staticmethod
+    def _enemy_team(entry: MonsterTeam|array) -> MonsterTeam:
+        """The team for an enemy queue entry, building it if the entry is lazy
+        Complexity O(1) for an eager entry and O(comp) for a lazy one"""
+        if isinstance(entry, MonsterTeam):
+            return entry
+        return MonsterTeam.from_picks(MonsterTeam.TeamMode.BACK, entry)
 
     
     def out_of_meta(self) -> ArrayR[Element]:
         """Return the array of elements
-        Complexity O(1) for best and O(n) worst case where n is the length of Elements"""
-        sorted_list = ArraySortedList(len(self.external_meta))
-        for element in Element:
-            if element.value in self.external_meta:
-                element = ListItem(element, element.value)
-                sorted_list.add(element)
-
+        Complexity O(n) for best and worst case where n is the number of elements out of the meta"""
         tower_ans = ArrayR(len(self.external_meta))
-        for i in range(len(sorted_list)):
-            tower_ans[i] = sorted_list[i].value
+        i = 0
+        for value in self.external_meta: # already in increasing order of Element value
+            tower_ans[i] = Element(value)
+            i += 1
         return tower_ans
 
     
@@ -172,13 +257,162 @@ class BattleTower:
         return self
     
 
+    def __next__(self):
+        """Return the next battle's tuple, as next_battle does
+        Complexity O(1) for best and O(n) worst case where n is the number of monster in the tower team
+        """
+        if self.battles_remaining():
+            return self.next_battle()
+        raise StopIteration
+
+    def stream_results(self, sink: ResultSink, limit: Optional[int] = None) -> int:
+        """Play the remaining battles, at most limit of them, writing one compact row per
+        battle to sink instead of returning the teams. Returns the number of battles played.
+        Rows are (battle index, result value, lives, enemy lives, enemy team id, turns).
+        Complexity O(n * comp) for best and worst case where n is the number of battles
+        """
+        played = 0
+        while self.battles_remaining() and (limit is None or played < limit):
+            index = self.battles_fought
+            enemy_id = self.current_enemy_id
+            result, _, _, lives, enemy_lives = self.next_battle()
+            sink.write((index, result.value, lives, enemy_lives, enemy_id, self.battle.turn_number))
+            played += 1
+        sink.flush()
+        return played
+
+    def enable_checkpoints(self, path: str, every: int) -> None:
+        """Save a checkpoint to path after every `every` battles
+        Complexity O(1) for best and worst case"""
+        if every <= 0:
+            raise ValueError("Checkpoint interval must be positive")
+        self.checkpoint_path = path
+        self.checkpoint_every = every
+
+    def save_checkpoint(self, path: str) -> None:
+        """Write the tower's state between battles to path
+        Teams are stored as TeamSpecs (lazy ones keep their picks) and lives as an int array, and the file
+        is replaced atomically so a crash mid-write keeps the previous one.
+        Complexity O(n) for best and worst case where n is the number of enemy teams
+        """
+        enemy_specs = []
+        enemy_lives = array("l")
+        enemy_ids = array("l")
+        # Rotate the queues all the way round to read them without changing them.
+        for _ in range(len(self.enemy)):
+            entry = self.enemy.serve()
+            lives = self.enemy_lives.serve()
+            enemy_id = self.enemy_ids.serve()
+            enemy_specs.append(entry.to_spec() if isinstance(entry, MonsterTeam) else entry)
+            enemy_lives.append(lives)
+            enemy_ids.append(enemy_id)
+            self.enemy.append(entry)
+            self.enemy_lives.append(lives)
+            self.enemy_ids.append(enemy_id)
+        state = (
+            self.CHECKPOINT_VERSION,
+            RandomGen.seed,
+            self.battles_fought,
+            self.mine.to_spec(),
+            self.mine_lives,
+            len(self.enemy.array),
+            enemy_specs,
+            enemy_lives,
+            enemy_ids,
+            self.current_enemy_entry.to_spec() if isinstance(self.current_enemy_entry, MonsterTeam) else self.current_enemy_entry,
+            self.current_enemy_lives,
+            self.current_enemy_id,
+            self.internal_meta.elems,
+            self.external_meta.elems,
+        )
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            pickle.dump(state, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+
+    @classmethod
+    def resume(cls, path: str, battle: Battle|None=None, record_history: bool=False) -> BattleTower:
+        """Rebuild a tower from a checkpoint and restore RandomGen, ready to keep iterating
+        The battles that follow are identical to those of the original tower.
+        Replay history starts again from the checkpoint.
+        :raises ValueError: if the file is not a checkpoint of this version.
+        Complexity O(n) for best and worst case where n is the number of enemy teams
+        """
+        with open(path, "rb") as f:
+            state = pickle.load(f)
+        if not isinstance(state, tuple) or state[0] != cls.CHECKPOINT_VERSION:
+            raise ValueError(f"{path} is not a version {cls.CHECKPOINT_VERSION} tower checkpoint")
+        (_, seed, battles_fought, mine_spec, mine_lives, capacity, enemy_specs,
+         enemy_lives, enemy_ids, current_spec, current_lives, current_id, internal_meta, external_meta) = state
+
+        tower = cls(battle, record_history)
+        tower.battles_fought = battles_fought
+        tower.mine = mine_spec.build()
+        tower.mine_lives = mine_lives
+        tower.enemy = CircularQueue(capacity)
+        tower.enemy_lives = CircularQueue(capacity)
+        tower.enemy_ids = CircularQueue(capacity)
+        for i in range(len(enemy_specs)):
+            tower.enemy_ids.append(enemy_ids[i])
+            spec = enemy_specs[i]
+            tower.enemy.append(spec.build() if isinstance(spec, TeamSpec) else spec)
+            tower.enemy_lives.append(enemy_lives[i])
+        tower.current_enemy_entry = current_spec.build() if isinstance(current_spec, TeamSpec) else current_spec
+        tower.current_enemy = None if current_spec is None else cls._enemy_team(tower.current_enemy_entry)
+        tower.current_enemy_lives = current_lives
+        tower.current_enemy_id = current_id
+        tower.internal_meta.elems = internal_meta
+        tower.external_meta.elems = external_meta
+        RandomGen.seed = seed
+        return tower
+
     def sort_by_lives(self):
-        # 1054 ONLY
-        raise NotImplementedError
+        """Reorder the enemy teams, the current one included, by increasing lives
+        Teams with equal lives keep their order, counting from the current team.
+        The queues are drained once into an array, merge sorted with
+        ArraySortedList.add_all and refilled, then the first team is served.
+        Complexity O(n log n) for best and worst case where n is the number of enemy teams
+        """
+        n = len(self.enemy) + (self.current_enemy is not None)
+        items = ArrayR(n)
+        i = 0
+        if self.current_enemy is not None:
+            items[i] = ListItem((self.current_enemy_entry, self.current_enemy_id), self.current_enemy_lives)
+            i += 1
+        while not self.enemy.is_empty():
+            items[i] = ListItem((self.enemy.serve(), self.enemy_ids.serve()), self.enemy_lives.serve())
+            i += 1
+
+        ordered = ArraySortedList(max(n, 1))
+        ordered.add_all(items)
+        for i in range(n):
+            item = ordered[i]
+            entry, enemy_id = item.value
+            self.enemy.append(entry)
+            self.enemy_ids.append(enemy_id)
+            self.enemy_lives.append(item.key)
+        self.next_team()
 
 def tournament_balanced(tournament_array: ArrayR[str]):
-    # 1054 ONLY
-    raise NotImplementedError
+    """True if a postfix tournament string is a single balanced bracket
+    Each team pushes a subtree size of 1 and each "+" pops two sizes, which must
+    be equal, and pushes their sum. The string is valid if it never pops an
+    empty stack and leaves exactly one size behind.
+    Complexity O(n) for best and worst case where n is the length of the string
+    """
+    sizes = ArrayStack(max(len(tournament_array), 1))
+    for token in tournament_array:
+        if token == "+":
+            if len(sizes) < 2:
+                return False
+            right = sizes.pop()
+            left = sizes.pop()
+            if left != right:
+                return False
+            sizes.push(left + right)
+        else:
+            sizes.push(1)
+    return len(sizes) == 1
 
 if __name__ == "__main__":
 
@@ -0,0 +1,144 @@
+from __future__ import annotations
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from typing import Iterable, Optional
+
+from battle import Battle
+from elements import Element
+from random_gen import RandomGen
+from team import TeamSpec
+from tower import BattleTower
+
+from data_structures.referential_array import ArrayR
+
+
+class TowerRun:
+    """
+    One tower to run: the spec of the player's team, how many enemy teams to
+    generate and the seed RandomGen is set to before anything is drawn.
+    """
+
+    def __init__(self, my_team: TeamSpec, n: int, seed: int) -> None:
+        """Store the tower setup
+        Complexity O(1) for best and worst case"""
+        self.my_team = my_team
+        self.n = n
+        self.seed = seed
+
+
+class TowerReport:
+    """Outcome of a single tower."""
+
+    def __init__(self, seed: int, battles: int, lives: int, enemy_lives: int, out_of_meta: ArrayR[Element]) -> None:
+        """Store the outcome
+        Complexity O(1) for best and worst case"""
+        self.seed = seed
+        self.battles = battles
+        self.lives = lives
+        self.enemy_lives = enemy_lives
+        self.out_of_meta = out_of_meta
+
+    def cleared(self) -> bool:
+        """True if the player beat every enemy team
+        Complexity O(1) for best and worst case"""
+        return self.lives > 0
+
+
+def _run_tower(run: TowerRun) -> TowerReport:
+    """Run one tower to completion, exactly as it would be run by hand.
+    Module level so it can be sent to worker processes.
+    Complexity O(comp) for best and worst case
+    """
+    saved_seed = RandomGen.seed
+    RandomGen.set_seed(run.seed)
+    try:
+        tower = BattleTower(Battle(verbosity=0))
+        tower.set_my_team(run.my_team.build())
+        tower.generate_teams(run.n)
+        battles = 0
+        while tower.battles_remaining():
+            tower.next_battle()
+            battles += 1
+
+        # Lives left in the tower: the team being served plus every queued one.
+        enemy_lives = tower.current_enemy_lives or 0
+        for _ in range(len(tower.enemy_lives)):
+            lives = tower.enemy_lives.serve()
+            enemy_lives += lives
+            tower.enemy_lives.append(lives)
+    finally:
+        RandomGen.seed = saved_seed
+    return TowerReport(run.seed, battles, tower.mine_lives, enemy_lives, tower.out_of_meta())
+
+
+class FleetReport:
+    """
+    Per-tower reports in input order, plus totals over the whole fleet.
+
+    meta_counts[e.value] is how many towers finished with element e out of meta.
+    """
+
+    def __init__(self, towers: ArrayR[TowerReport]) -> None:
+        """Aggregate the tower reports
+        Complexity O(n * e) for best and worst case where n is the number of towers and e the number of elements"""
+        self.towers = towers
+        self.battles = 0
+        self.cleared = 0
+        self.lives = 0
+        self.enemy_lives = 0
+        self.meta_counts = array("l", [0]) * (len(Element.__members__) + 1)
+        for tower in towers:
+            self.battles += tower.battles
+            self.cleared += tower.cleared()
+            self.lives += tower.lives
+            self.enemy_lives += tower.enemy_lives
+            for element in tower.out_of_meta:
+                self.meta_counts[element.value] += 1
+
+    def __len__(self) -> int:
+        return len(self.towers)
+
+    def __str__(self) -> str:
+        return (
+            f"{len(self)} towers, {self.cleared} cleared, {self.battles} battles, "
+            f"{self.lives} lives left, {self.enemy_lives} enemy lives left"
+        )
+
+
+class TowerFleet:
+    """
+    Runs many independent BattleTowers, optionally across a process pool.
+
+    Each tower is seeded from its TowerRun, so every report is identical to
+    running that tower serially with the same seed, whatever the worker count.
+
+    Usage:
+        fleet = TowerFleet(workers=4)
+        report = fleet.run(TowerRun(spec, 10, seed) for seed in seeds)
+    """
+
+    CHUNK_SIZE = 8
+
+    def __init__(self, workers: Optional[int] = None, chunk_size: int = CHUNK_SIZE) -> None:
+        """Set the pool size; None or 1 runs every tower in this process
+        Complexity O(1) for best and worst case"""
+        self.workers = workers
+        self.chunk_size = chunk_size
+
+    def run(self, runs: Iterable[TowerRun]) -> FleetReport:
+        """Run every tower and aggregate the outcomes
+        Complexity O(n * comp) for best and worst case where n is the number of towers"""
+        if self.workers is None or self.workers <= 1:
+            reports = [_run_tower(run) for run in runs]
+        else:
+            with ProcessPoolExecutor(max_workers=self.workers) as pool:
+                reports = list(pool.map(_run_tower, runs, chunksize=self.chunk_size))
+        return FleetReport(ArrayR.from_list(reports))
+
+
+if __name__ == "__main__":
+    from team import MonsterTeam
+
+    spec = TeamSpec(MonsterTeam.TeamMode.BACK, MonsterTeam.SelectionMode.RANDOM)
+    report = TowerFleet(workers=2).run(TowerRun(spec, 5, seed) for seed in range(100))
+    print(report)